@@ -0,0 +1 @@
+"""Benchmark harness for the HR dashboard data path (see benchmarks.run)."""
@@ -0,0 +1,176 @@
+"""Times the dashboard data path on synthetic workbooks and flags regressions.
+
+    python -m benchmarks.run                       # 1k and 10k, compare to baseline
+    python -m benchmarks.run --sizes 1000 100000
+    python -m benchmarks.run --update-baseline     # record this machine's numbers
+    python -m benchmarks.run --workers 4           # force the worker-process parse path
+
+Stages, per size:
+
+    cold_load       parse every workbook with empty snapshot and memo caches
+    snapshot_load   restart: snapshots on disk, in-process memos empty
+    warm_load       everything cached (the per-rerun cost)
+    index           build_index() on a fresh memo
+    aggregates      build_aggregates() on a fresh memo
+    <page>.view     the page's numbers as the JSON API shapes them
+    <page>.figures  building the page's Plotly figures and serializing them
+
+Timings are wall-clock seconds, best of --repeat runs (cold stages run once).
+Baselines are only meaningful on the machine that recorded them.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from datetime import datetime
+
+from hr_analytics import api, charts, ingest, leave, snapshot
+from hr_analytics.aggregates import build_aggregates, build_section
+from hr_analytics.index import build_index, index_dataset
+from hr_analytics.loaders import LOADERS
+from hr_analytics.theme import DANGER, SECONDARY
+
+from . import synth
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+WORK_DIR = os.path.join(snapshot.CACHE_DIR, "bench")
+WINDOW = 15  # rows per Movement page, as first rendered
+
+
+def page_figures(aggs):
+    """{page: [figure builders]} matching what each dashboard page draws on first render.
+
+    Builders are called when timed, so a page's stage only pays for its own figures.
+    """
+    movement = [lambda: charts.exit_trend(aggs["exit_trend"])]
+    for df, color in ((aggs["joiners"], SECONDARY), (aggs["leavers"], DANGER)):
+        if not df.empty: movement.append(lambda df=df, color=color: charts.name_bars(df.head(WINDOW), color))
+    return {
+        "overview": [lambda: charts.bu_headcount(aggs["bu_counts"]), lambda: charts.performance_pulse(aggs["perf_counts"])],
+        "recruitment": [lambda: charts.hiring_funnel(aggs["funnel"])],
+        "movement": movement,
+        "org": [lambda: charts.org_sunburst(aggs["org_tree"], aggs["org_path"])] if aggs["org_path"] else [],
+        "performance": [lambda: charts.performance_distribution(aggs["perf_counts"])]
+                       + ([lambda: charts.leave_trend(aggs["leave_trend"])] if not aggs["leave_trend"].empty else []),
+        "attendance": [lambda: charts.attendance_trend(aggs["attendance_org_monthly"])],
+    }
+
+
+def clear_memos():
+    for fn in (*LOADERS.values(), leave.read_summary, ingest.combine, index_dataset, build_section):
+        fn.cache_clear()
+
+
+def timed(fn, repeat=1):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_size(size, repeat, seed):
+    data_dir = os.path.join(WORK_DIR, f"data-{size}-{seed}")
+    if not all(os.path.exists(os.path.join(data_dir, f)) for f in synth.FILES):
+        print(f"  generating {size} employees/requisitions ...", file=sys.stderr)
+        synth.generate(data_dir, employees=size, seed=seed)
+    snap_dir = os.path.join(WORK_DIR, f"snapshots-{size}")
+    shutil.rmtree(snap_dir, ignore_errors=True)
+    ingest.DATA_DIR, snapshot.SNAPSHOT_DIR = data_dir, snap_dir
+
+    results = {}
+    clear_memos()
+    results["cold_load"], _ = timed(ingest.load_data)
+
+    def reload():
+        clear_memos()
+        return ingest.load_data()
+    results["snapshot_load"], _ = timed(reload, repeat)
+    results["warm_load"], data = timed(ingest.load_data, repeat)
+
+    versions = ingest.data_versions()
+    month = (datetime.now().year, datetime.now().month)
+
+    def index():
+        index_dataset.cache_clear()
+        return build_index(versions, data)
+
+    def aggregates():
+        build_section.cache_clear()
+        return build_aggregates(versions, month, data)
+    results["index"], _ = timed(index, repeat)
+    results["aggregates"], aggs = timed(aggregates, repeat)
+
+    state = api.current_state()
+    figures = page_figures(aggs)
+    for page, view in api.VIEWS.items():
+        results[f"{page}.view"], _ = timed(lambda: view(state), repeat)
+        results[f"{page}.figures"], _ = timed(lambda: [build().to_json() for build in figures[page]], repeat)
+    return results
+
+
+def compare(current, baseline, tolerance, min_delta):
+    """[(size, stage, base, now)] for stages slower than baseline by more than tolerance and min_delta."""
+    slower = []
+    for size, stages in current.items():
+        for stage, now in stages.items():
+            base = baseline.get(size, {}).get(stage)
+            if base is not None and now > base * (1 + tolerance) and now - base > min_delta:
+                slower.append((size, stage, base, now))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the HR dashboard data path.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--workers", type=int, help="ingest worker processes (default: HR_INGEST_WORKERS or the CPU count)")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown ratio (default 0.25)")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="ignore slowdowns under this many seconds")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+    if args.workers:
+        ingest.INGEST_WORKERS = args.workers
+    print(f"{ingest.INGEST_WORKERS} ingest workers on {os.cpu_count()} CPUs", file=sys.stderr)
+
+    current = {}
+    for size in args.sizes:
+        print(f"size {size}", file=sys.stderr)
+        current[str(size)] = bench_size(size, args.repeat, args.seed)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f: baseline = json.load(f)
+
+    stages = list(next(iter(current.values())))
+    print(f"{'stage':<22}" + "".join(f"{size:>12}" + f"{'vs base':>10}" for size in current))
+    for stage in stages:
+        line = f"{stage:<22}"
+        for size, results in current.items():
+            base = baseline.get(size, {}).get(stage)
+            ratio = f"{results[stage] / base:>9.2f}x" if base else f"{'-':>10}"
+            line += f"{results[stage] * 1000:>10.1f}ms" + ratio
+        print(line)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f: json.dump(current, f, indent=2)
+    if args.update_baseline:
+        baseline.update({size: {k: round(v, 6) for k, v in r.items()} for size, r in current.items()})
+        with open(args.baseline, "w", encoding="utf-8") as f: json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+
+    slower = compare(current, baseline, args.tolerance, args.min_delta)
+    for size, stage, base, now in slower:
+        print(f"REGRESSION size={size} {stage}: {base * 1000:.1f}ms -> {now * 1000:.1f}ms", file=sys.stderr)
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""Synthetic HR workbooks with the same layout as the real ones.
+
+    python -m benchmarks.synth OUT_DIR --employees 10000 --requisitions 10000
+
+Writes a master sheet (Active/Inactive Staff, header below section labels),
+a hiring Progress sheet, an Evaluation Data sheet, a leave Summary with
+the two-row header that produces the ``.1``/``.2`` columns and a year of
+daily working-hours sheets. File names follow the patterns
+hr_analytics.ingest discovers.
+"""
+import argparse
+import os
+import random
+from datetime import datetime, time, timedelta
+
+from openpyxl import Workbook
+
+BUSINESS_UNITS = ["FAMS Tech IP", "Voltro GCC", "FAMS PK", "JetClass", "Voltro", "CEO Office"]
+DEPARTMENTS = ["Development", "Marketing", "Finance", "Operations", "Sales", "HR"]
+DESIGNATIONS = ["Software Engineer", "Senior Software Engineer", "Team Lead", "Designer",
+                "Marketing Executive", "Accountant", "HR Executive", "Intern"]
+STATUSES = ["Permanent", "Probation", "Contract", "Internship"]
+STANDINGS = ["Hired", "Offer sent", "Interview scheduled", "Shortlisted", "Sourcing", "On hold", "Joined"]
+LEAVE_TYPES = ["CL", "SL", "AL", "ML", "PL", "UL/HL", "COMP-L", "WFH"]
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+
+MASTER_FILE = "Employee Master Sheet - Synthetic Office.xlsx"
+HIRING_FILE = "Hirings Requests Synthetic.xlsx"
+PERF_FILE = "Increment - Synthetic Office _ Apr - Sep 25.xlsx"
+LEAVE_FILE = "Leave Record - 2025.xlsx"
+HOURS_FILE = "Staff Working Hours - 2025.xlsx"
+FILES = (MASTER_FILE, HIRING_FILE, PERF_FILE, LEAVE_FILE, HOURS_FILE)
+DAY_CODES = ["SL", "CL", "AL", "WFH", "WFH", "Holiday"]
+
+
+def _name(rng, i):
+    first = rng.choice(["Ali", "Sara", "Hamza", "Ayesha", "Usman", "Fatima", "Bilal", "Zainab", "Omar", "Hina"])
+    last = rng.choice(["Khan", "Ahmed", "Raza", "Hussain", "Malik", "Butt", "Sheikh", "Qureshi"])
+    return f"{first} {last} {i}"
+
+
+def _date(rng, start, days):
+    return start + timedelta(days=rng.randrange(days))
+
+
+def write_master(path, rng, employees):
+    wb = Workbook(write_only=True)
+    active = wb.create_sheet("Active Staff")
+    active.append(["SHARED SERVICES"])
+    active.append(["SYNTHETIC"])
+    active.append(["Head Counts", "Employee Number", "Name", "Designation", "Department", "Reporting To",
+                   "Business Unit", "Employment Status", "Joining Date", "Email", "Current Salary(PKR)"])
+    n_active = int(employees * 0.6)
+    managers = [_name(rng, i) for i in range(max(1, n_active // 12))]
+    for i in range(n_active):
+        if i % 250 == 0: active.append([rng.choice(DEPARTMENTS)])  # section label rows
+        name = managers[i] if i < len(managers) else _name(rng, i)
+        active.append([i + 1, f"SYN-{100 + i}", name, rng.choice(DESIGNATIONS), rng.choice(DEPARTMENTS),
+                       rng.choice(managers[:max(1, i)]) if i else None, rng.choice(BUSINESS_UNITS),
+                       rng.choice(STATUSES), _date(rng, datetime(2018, 1, 1), 2900), f"user{i}@example.com",
+                       rng.randrange(40000, 600000, 5000)])
+    inactive = wb.create_sheet("Inactive Staff")
+    inactive.append(["Sr.No", "Name", "Designation", "Joining Date", "Business Unit", "Technical/Non Technical",
+                     "Gross Salary(PKR)", "Exit Date", "Employment Status", "Reason"])
+    for i in range(employees - n_active):
+        joined = _date(rng, datetime(2018, 1, 1), 2200)
+        inactive.append([i + 1, _name(rng, n_active + i), rng.choice(DESIGNATIONS), joined, rng.choice(BUSINESS_UNITS),
+                         rng.choice(["Technical", "Non Technical"]), rng.randrange(20000, 400000, 5000),
+                         joined + timedelta(days=rng.randrange(30, 900)), rng.choice(["Resigned", "Terminated", "Internship Completed"]),
+                         rng.choice(["Better offer", "Relocation", "Higher studies", None])])
+    wb.save(path)
+
+
+def write_hiring(path, rng, requisitions):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Progress")
+    ws.append(["BU", "Position", "Timeline", "Project", "Location", "Duration", "Budget", "Request by",
+               "Priority", "Status", "Wagas Comments", "Standing", "Recruitment Team Comments"])
+    for i in range(requisitions):
+        ws.append([rng.choice(BUSINESS_UNITS), rng.choice(DESIGNATIONS), None, f"P{i % 40}",
+                   rng.choice(["Pakistan", "UAE"]), "Permanent", None, _name(rng, i), rng.choice(["High", "Medium", "Low"]),
+                   "Management Approved", None, rng.choice(STANDINGS), None])
+    wb.save(path)
+
+
+def write_performance(path, rng, employees):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Evaluation Data")
+    ws.append(["Sr. No.", "Name", "Completion Date", "Self (Out of 25)", "HR (Out of 25)", "Team Lead (Out of 50)",
+               "Evaluated By", "Total Points (Out of 100)", "Pending Months", "Evaluation Form"])
+    for i in range(int(employees * 0.4)):
+        s, h, t = round(rng.uniform(15, 25), 2), round(rng.uniform(10, 25), 2), round(rng.uniform(25, 50), 1)
+        ws.append([i + 1, _name(rng, i), datetime(2025, 7, 1), s, h, t, _name(rng, i + 7), round(s + h + t, 2),
+                   rng.randrange(3, 18), f"form{i}.xlsx"])
+    wb.save(path)
+
+
+def write_leave(path, rng, employees):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Summary")
+    # block labels sit over each block's first column, as in the real sheet
+    groups = ["Qouta"] + [None] * 7 + ["Availed"] + [None] * 10 + ["Remaining"] + [None] * 7 + [None]
+    per_month = ["Present", "NLT", "LWP"] + LEAVE_TYPES
+    for m in MONTHS:
+        groups += [m] + [None] * (len(per_month) - 1)
+    ws.append(["No.", "Employee Name", "Designation", "Joining Date"] + groups)
+    ws.append([None] * 4 + LEAVE_TYPES + ["Present", "NLT", "LWP"] + LEAVE_TYPES + LEAVE_TYPES + [None]
+              + per_month * len(MONTHS))
+    for i in range(int(employees * 0.6)):
+        quota = [10, 8, 14, None, 10, 15, 3, 52, 67, 67, 0]
+        availed = [rng.randrange(0, q + 1) if q else 0 for q in quota[:8]]
+        remaining = [(q or 0) - a for q, a in zip(quota[:8], availed)]
+        monthly = [rng.randrange(0, 3) for _ in range(len(per_month) * len(MONTHS))]
+        ws.append([i + 1, _name(rng, i), rng.choice(DESIGNATIONS), _date(rng, datetime(2018, 1, 1), 2900)]
+                  + quota + availed + remaining + [None] + monthly)
+    wb.save(path)
+
+
+def write_hours(path, rng, employees, year=2025):
+    wb = Workbook(write_only=True)
+    names = [_name(rng, i) for i in range(int(employees * 0.6))]
+    for month in range(1, 13):
+        start = datetime(year, month, 1)
+        days = [start + timedelta(days=d) for d in range(31) if (start + timedelta(days=d)).month == month]
+        ws = wb.create_sheet(MONTHS[month - 1][:3])
+        ws.append(["Shift", "No.", "Employee Name", "Total Hours"] + [d.strftime("%a") for d in days])
+        ws.append([None] * 4 + days)
+        for i, name in enumerate(names):
+            cells = []
+            for d in days:
+                if d.weekday() >= 5: cells.append(None)
+                elif rng.random() < 0.12: cells.append(rng.choice(DAY_CODES))
+                else: cells.append(time(rng.randrange(6, 11), rng.randrange(60)))
+            ws.append(["9:00 - 6:00", i + 1, name, None] + cells)
+    wb.save(path)
+
+
+def generate(out_dir, employees=1000, requisitions=None, seed=7):
+    """Writes the five synthetic workbooks into out_dir and returns their paths."""
+    rng = random.Random(seed)
+    requisitions = requisitions or employees
+    os.makedirs(out_dir, exist_ok=True)
+    paths = [os.path.join(out_dir, f) for f in FILES]
+    write_master(paths[0], rng, employees)
+    write_hiring(paths[1], rng, requisitions)
+    write_performance(paths[2], rng, employees)
+    write_leave(paths[3], rng, employees)
+    write_hours(paths[4], rng, employees)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic HR workbooks.")
+    parser.add_argument("out_dir")
+    parser.add_argument("--employees", type=int, default=1000)
+    parser.add_argument("--requisitions", type=int)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    for path in generate(args.out_dir, args.employees, args.requisitions, args.seed):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
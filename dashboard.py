@@ -1,10 +1,13 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 import os
-import requests
-from datetime import datetime
+import json
+import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from hr_analytics import current_state, drill, latest_period, leave, lookup, policies, telemetry, timeseries
+from hr_analytics.snapshot import CACHE_DIR
 
 # ==============================================================================
 # 1. APP CONFIGURATION & THEME
@@ -17,31 +20,73 @@ st.set_page_config(
 )
 
 # --- COLOR PALETTE ---
-PRIMARY = "#2E86C1"    # Falkenherz Blue
-SECONDARY = "#2ECC71"  # Success Green
-DANGER = "#E74C3C"     # Red for Exits
-TEXT_COLOR = "#1F2937" 
-CARD_BG = "#FFFFFF"
-BG_COLOR = "#F4F6F9"
+from hr_analytics.theme import PRIMARY, SECONDARY, DANGER, TEXT_COLOR, CARD_BG, BG_COLOR
 
 # --- LOTTIE ANIMATION LOADER ---
+# Animations are decoration, so rendering never waits on them. Each one is
+# read from assets/lottie/ (bundled) or the on-disk cache if present, else
+# fetched once per process on a background thread and cached to disk. Until
+# a fetch finishes (or when offline) the header simply renders without it.
+LOTTIE_URLS = {
+    "hr": "https://assets5.lottiefiles.com/packages/lf20_5tl1xxnz.json",
+    "hiring": "https://assets9.lottiefiles.com/packages/lf20_w51pcehl.json",
+    "move": "https://assets2.lottiefiles.com/packages/lf20_hX7y8C.json",
+}
+LOTTIE_DIRS = [os.path.join("assets", "lottie"), os.path.join(CACHE_DIR, "lottie")]
+
+def _read_lottie_file(name):
+    for d in LOTTIE_DIRS:
+        path = os.path.join(d, f"{name}.json")
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f: return json.load(f)
+            except (OSError, ValueError): pass
+    return None
+
+def _fetch_lottie(name, url):
+    try:
+        import requests  # only needed on the background fetch
+        r = requests.get(url, timeout=5)
+        if r.status_code != 200: return None
+        animation = r.json()
+    except: return None
+    try:
+        os.makedirs(LOTTIE_DIRS[-1], exist_ok=True)
+        tmp = os.path.join(LOTTIE_DIRS[-1], f"{name}.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f: json.dump(animation, f)
+        os.replace(tmp, os.path.join(LOTTIE_DIRS[-1], f"{name}.json"))
+    except OSError: pass
+    return animation
+
 try:
     from streamlit_lottie import st_lottie
-    @st.cache_data(ttl=86400) 
-    def load_lottieurl(url: str):
-        try:
-            r = requests.get(url, timeout=5)
-            if r.status_code != 200: return None
-            return r.json()
-        except: return None
+
+    @st.cache_resource(ttl=86400)
+    def _lottie_jobs():
+        """One job per animation, shared by every session of this process."""
+        pool = ThreadPoolExecutor(max_workers=len(LOTTIE_URLS), thread_name_prefix="lottie")
+        jobs = {}
+        for name, url in LOTTIE_URLS.items():
+            local = _read_lottie_file(name)
+            if local is not None:
+                jobs[name] = Future()
+                jobs[name].set_result(local)
+            else:
+                jobs[name] = pool.submit(_fetch_lottie, name, url)
+        pool.shutdown(wait=False)
+        return jobs
+
+    def get_lottie(name):
+        job = _lottie_jobs().get(name)
+        return job.result() if job is not None and job.done() else None
 except ImportError:
     def st_lottie(animation_json, height=200, key=None):
         pass 
-    def load_lottieurl(url): return None
+    def get_lottie(name): return None
 
-lottie_hr = load_lottieurl("https://assets5.lottiefiles.com/packages/lf20_5tl1xxnz.json") 
-lottie_hiring = load_lottieurl("https://assets9.lottiefiles.com/packages/lf20_w51pcehl.json") 
-lottie_move = load_lottieurl("https://assets2.lottiefiles.com/packages/lf20_hX7y8C.json") 
+lottie_hr = get_lottie("hr")
+lottie_hiring = get_lottie("hiring")
+lottie_move = get_lottie("move")
 
 # --- ADVANCED CSS ---
 st.markdown(f"""
@@ -81,87 +126,7 @@ st.markdown(f"""
 """, unsafe_allow_html=True)
 
 # ==============================================================================
-# 2. DATA ENGINE
-# ==============================================================================
-@st.cache_data
-def load_data():
-    data = {
-        "active": pd.DataFrame(), "inactive": pd.DataFrame(),
-        "recruitment": pd.DataFrame(), "performance": pd.DataFrame(), "leave": pd.DataFrame()
-    }
-    
-    master_file = "Employee Master Sheet - Lahore Office.xlsx"
-    if os.path.exists(master_file):
-        try:
-            # Active Staff
-            df_temp = pd.read_excel(master_file, sheet_name="Active Staff", header=None, nrows=15)
-            header_idx = None
-            for i, row in df_temp.iterrows():
-                if "Employee Number" in row.astype(str).values.tolist() and "Name" in row.astype(str).values.tolist():
-                    header_idx = i; break
-            
-            if header_idx is not None:
-                df_act = pd.read_excel(master_file, sheet_name="Active Staff", header=header_idx)
-                df_act = df_act[df_act['Name'].notna()]
-                df_act = df_act[df_act['Employee Number'] != 'Employee Number']
-                if 'Business Unit' in df_act.columns: df_act['Business Unit'].fillna('Unassigned', inplace=True)
-                if 'Reporting To' in df_act.columns: df_act['Reporting To'].fillna('Direct to CEO', inplace=True)
-                if 'Joining Date' in df_act.columns: df_act['Joining Date'] = pd.to_datetime(df_act['Joining Date'], errors='coerce')
-                data["active"] = df_act
-
-            # Inactive Staff
-            df_inact = pd.read_excel(master_file, sheet_name="Inactive Staff", header=0)
-            if 'Exit Date' in df_inact.columns: df_inact['Exit Date'] = pd.to_datetime(df_inact['Exit Date'], errors='coerce')
-            data["inactive"] = df_inact
-        except: pass
-
-    # Recruitment
-    rec_file = "Hirings Requests UAE & PK.xlsx"
-    if os.path.exists(rec_file):
-        try:
-            df_rec = pd.read_excel(rec_file, sheet_name="Progress")
-            def get_stage(x):
-                s = str(x).lower()
-                if "join" in s or "hired" in s: return "Hired"
-                if "offer" in s: return "Offer Extended"
-                if "interview" in s: return "Interview"
-                if "shortlist" in s: return "Shortlisted"
-                return "Applied"
-            if 'Standing' in df_rec.columns: df_rec['Funnel Stage'] = df_rec['Standing'].apply(get_stage)
-            data["recruitment"] = df_rec
-        except: pass
-
-    # Performance
-    perf_file = "Increment - Lahore Office _ Apr - Sep 25.xlsx"
-    if os.path.exists(perf_file):
-        try:
-            df_perf = pd.read_excel(perf_file, sheet_name="Evaluation Data")
-            if 'Total Points (Out of 100)' in df_perf.columns:
-                df_perf['Total Points (Out of 100)'] = pd.to_numeric(df_perf['Total Points (Out of 100)'], errors='coerce')
-                df_perf['Category'] = df_perf['Total Points (Out of 100)'].apply(lambda x: "High Performer" if x>=85 else ("Low Performer" if x<70 else "Average"))
-                data["performance"] = df_perf
-        except: pass
-
-    # Leave
-    leave_file = "Leave Record - 2025.xlsx"
-    if os.path.exists(leave_file):
-        try:
-            df_leave = pd.read_excel(leave_file, sheet_name="Summary", header=1)
-            if 'Employee Name' not in df_leave.columns: df_leave.rename(columns={df_leave.columns[1]: 'Employee Name'}, inplace=True)
-            df_leave = df_leave[df_leave['Employee Name'].notna()]
-            availed_cols = [c for c in df_leave.columns if str(c).endswith('.1')]
-            df_leave['Total Availed'] = df_leave[availed_cols].apply(pd.to_numeric, errors='coerce').sum(axis=1) if availed_cols else 0
-            data["leave"] = df_leave
-        except: pass
-
-    return data
-
-datasets = load_data()
-df_active, df_inactive = datasets["active"], datasets["inactive"]
-df_rec, df_perf, df_leave = datasets["recruitment"], datasets["performance"], datasets["leave"]
-
-# ==============================================================================
-# 3. SIDEBAR BRANDING
+# 2. SIDEBAR BRANDING
 # ==============================================================================
 with st.sidebar:
     st.image("FHZ-Logo-2.png", use_container_width=True)
@@ -172,6 +137,7 @@ with st.sidebar:
         "Employee Movement", 
         "Organization Structure",
         "Performance & Leave",
+        "Attendance & Hours",
         "Policies & Docs"
     ])
     st.markdown("---")
@@ -181,28 +147,111 @@ with st.sidebar:
     with c2: st.image("vertical-logo-light-background.png", use_container_width=True)
     with c3: st.image("Untitled-2-01 - Copy - Copy-1 (2).png", use_container_width=True)
 
+# ==============================================================================
+# 3. DATA ENGINE
+# ==============================================================================
+# Loading, indexing and aggregation live in the hr_analytics package (shared
+# with the JSON API and batch exports); the app only renders what it returns.
+# Each page names the aggregate sections it shows, and only the datasets those
+# read are loaded, so light pages don't wait on workbooks they never use.
+PAGE_SECTIONS = {
+    "Overview": ["headcount", "performance"],
+    "Recruitment Pipeline": ["recruitment", "interviews"],
+    "Employee Movement": ["movement", "workforce"],
+    "Organization Structure": ["org"],
+    "Performance & Leave": ["performance", "leave"],
+    "Attendance & Hours": ["attendance"],
+    "Policies & Docs": [],
+}
+EMPTY = pd.DataFrame()
+
+run = telemetry.start_run(menu)
+with telemetry.span("data.current_state"):
+    state = current_state(sections=PAGE_SECTIONS[menu])
+versions, datasets, index, aggs, now = state["versions"], state["data"], state["index"], state["aggs"], state["now"]
+df_active, df_inactive = datasets.get("active", EMPTY), datasets.get("inactive", EMPTY)
+df_rec = datasets.get("recruitment", EMPTY)
+df_perf, df_leave = latest_period(datasets.get("performance", EMPTY)), latest_period(datasets.get("leave", EMPTY))
+
+# --- CHART RENDERING ---
+# Figure building is timed inside hr_analytics.charts; this times Streamlit's
+# side (serializing the figure and shipping it to the browser).
+def show_chart(fig, **kwargs):
+    with telemetry.span("render.plotly_chart"):
+        return st.plotly_chart(fig, **kwargs)
+
+# --- MARKDOWN TEXT ---
+# Document text shown through st.markdown must not be read as formatting
+# (asterisks, brackets, ":emoji:" codes, "$" math).
+def md_escape(text):
+    return re.sub(r"([\\`*_{}\[\]<>()#+\-.!|$~:])", r"\\\1", text)
+
+# --- PAGED NAME CHARTS ---
+# One bar per person only works for short lists, so the Movement panels build
+# and send just the visible window. Search narrows the window, and jumping to
+# a name moves to the page that holds it.
+PAGE_SIZE_OPTIONS = [15, 30, 60]
+
+def paged_name_chart(df, names, key, color):
+    """Renders a windowed bar list of df['Name']; returns the clicked name or None."""
+    from hr_analytics import charts
+
+    c_search, c_jump, c_size = st.columns([2, 2, 1])
+    query = c_search.text_input("Search", key=f"{key}_search", placeholder="Filter by name")
+    view = np.arange(len(df))
+    if query:
+        view = view[pd.Series(names["lower"]).str.contains(query.lower(), regex=False).to_numpy()]
+    size = c_size.selectbox("Rows", PAGE_SIZE_OPTIONS, key=f"{key}_size")
+    pages = max(1, -(-len(view) // size))
+
+    def jump():
+        target = st.session_state[f"{key}_jump"]
+        if target in names["positions"]:
+            pos = names["positions"][target][0]
+            st.session_state[f"{key}_search"] = ""
+            st.session_state[f"{key}_page"] = int(pos) // st.session_state[f"{key}_size"] + 1
+    c_jump.selectbox("Jump to", list(names["positions"]), index=None, key=f"{key}_jump",
+                     placeholder="Select a name", on_change=jump)
+
+    if st.session_state.get(f"{key}_page", 1) > pages: st.session_state[f"{key}_page"] = pages
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=f"{key}_page")
+    window = df.iloc[view[(page - 1) * size: page * size]]
+
+    clicked = None
+    with st.container(height=400):
+        if window.empty:
+            st.caption("No names match the search.")
+            return None
+        fig = charts.name_bars(window, color)
+        sel = show_chart(fig, use_container_width=True, on_select="rerun", key=f"{key}_chart")
+        if sel and sel['selection']['points']:
+            clicked = sel['selection']['points'][0]['y']
+
+    return clicked if clicked in names["positions"] else None
+
 # ==============================================================================
 # 4. MODULES
 # ==============================================================================
+# Plotly is only imported (through hr_analytics.charts) by the pages that draw.
+
+page_start = time.perf_counter()
 
 # --- OVERVIEW ---
 if menu == "Overview":
+    from hr_analytics import charts
     c1, c2 = st.columns([3, 1])
     with c1: st.title("Dashboard Overview")
     with c2: 
         if lottie_hr: st_lottie(lottie_hr, height=100, key="hr")
     
     if not df_active.empty:
-        total = len(df_active) + len(df_inactive)
-        active = len(df_active)
-        retention = (active / total * 100) if total else 0
-        probation = df_active['Employment Status'].str.contains('Probation', case=False).sum() if 'Employment Status' in df_active.columns else 0
+        hc = aggs["headcount"]
         
         k1, k2, k3, k4 = st.columns(4)
-        k1.metric("Total Headcount", total)
-        k2.metric("Active Employees", active, delta=f"{len(df_inactive)} Exited", delta_color="inverse")
-        k3.metric("Retention Rate", f"{retention:.1f}%")
-        k4.metric("On Probation", probation, delta="Review", delta_color="inverse")
+        k1.metric("Total Headcount", hc["total"])
+        k2.metric("Active Employees", hc["active"], delta=f"{hc['exited']} Exited", delta_color="inverse")
+        k3.metric("Retention Rate", f"{hc['retention']:.1f}%")
+        k4.metric("On Probation", hc["probation"], delta="Review", delta_color="inverse")
         
         st.markdown("---")
         
@@ -211,59 +260,45 @@ if menu == "Overview":
             st.markdown('<div class="chart-box">', unsafe_allow_html=True)
             st.subheader("Headcount by Venture")
             if 'Business Unit' in df_active.columns:
-                bu_counts = df_active['Business Unit'].value_counts().reset_index()
-                bu_counts.columns = ['Business Unit', 'Count']
-                fig = px.bar(bu_counts, x='Business Unit', y='Count', color='Business Unit', text='Count', 
-                             color_discrete_sequence=px.colors.qualitative.Prism)
-                fig.update_layout(plot_bgcolor="white", paper_bgcolor="white", font=dict(color=TEXT_COLOR), showlegend=False)
+                fig = charts.bu_headcount(aggs["bu_counts"])
                 
-                selected = st.plotly_chart(fig, use_container_width=True, on_select="rerun")
+                selected = show_chart(fig, use_container_width=True, on_select="rerun")
                 
                 if selected and selected['selection']['points']:
                     clicked = selected['selection']['points'][0]['x']
                     st.success(f"Drilling down: **{clicked}**")
-                    st.dataframe(df_active[df_active['Business Unit'] == clicked][['Name', 'Designation', 'Reporting To']], use_container_width=True)
+                    st.dataframe(drill(datasets, index, "active", 'Business Unit', clicked)[['Name', 'Designation', 'Reporting To']], use_container_width=True)
             st.markdown('</div>', unsafe_allow_html=True)
 
         with c2:
             st.markdown('<div class="chart-box">', unsafe_allow_html=True)
             st.subheader("Performance Pulse")
             if not df_perf.empty:
-                cat_counts = df_perf['Category'].value_counts().reset_index()
-                cat_counts.columns = ['Category', 'Count']
-                fig = px.pie(cat_counts, names='Category', values='Count', hole=0.6,
-                             color='Category', color_discrete_map={'High Performer': '#2ECC71', 'Average': '#F1C40F', 'Low Performer': '#E74C3C'})
-                fig.update_layout(plot_bgcolor="white", paper_bgcolor="white", font=dict(color=TEXT_COLOR), margin=dict(t=0, b=0, l=0, r=0), showlegend=False)
-                st.plotly_chart(fig, use_container_width=True)
+                fig = charts.performance_pulse(aggs["perf_counts"])
+                show_chart(fig, use_container_width=True)
             st.markdown('</div>', unsafe_allow_html=True)
 
 # --- RECRUITMENT ---
 elif menu == "Recruitment Pipeline":
+    from hr_analytics import charts
     c1, c2 = st.columns([3, 1])
     with c1: st.title("Talent Acquisition")
     with c2: 
         if lottie_hiring: st_lottie(lottie_hiring, height=90, key="hire")
     
     if not df_rec.empty:
-        open_pos = len(df_rec) - df_rec[df_rec['Funnel Stage'] == 'Hired'].shape[0]
+        pipeline = aggs["pipeline"]
         c1, c2, c3 = st.columns(3)
-        c1.metric("Open Requisitions", open_pos)
-        c2.metric("Total Pipeline", len(df_rec))
-        c3.metric("Closed/Hired", len(df_rec) - open_pos)
+        c1.metric("Open Requisitions", pipeline["open"])
+        c2.metric("Total Pipeline", pipeline["total"])
+        c3.metric("Closed/Hired", pipeline["hired"])
         
         st.markdown("---")
         st.subheader("Interactive Hiring Funnel")
         
-        counts = df_rec['Funnel Stage'].value_counts().reset_index()
-        counts.columns = ['Stage', 'Count']
-        order = ['Applied', 'Shortlisted', 'Interview', 'Offer Extended', 'Hired']
-        counts['Stage'] = pd.Categorical(counts['Stage'], categories=order, ordered=True)
-        counts = counts.sort_values('Stage')
-        
-        fig = px.funnel(counts, x='Count', y='Stage', color='Stage', color_discrete_sequence=px.colors.qualitative.Safe)
-        fig.update_layout(plot_bgcolor="white", paper_bgcolor="white", font=dict(color=TEXT_COLOR))
+        fig = charts.hiring_funnel(aggs["funnel"])
         
-        sel = st.plotly_chart(fig, use_container_width=True, on_select="rerun")
+        sel = show_chart(fig, use_container_width=True, on_select="rerun")
         
         stage = None
         if sel and sel['selection']['points']:
@@ -272,41 +307,28 @@ elif menu == "Recruitment Pipeline":
         st.markdown("### 📋 Candidate Details")
         if stage:
             st.info(f"Showing details for: **{stage}**")
-            st.dataframe(df_rec[df_rec['Funnel Stage'] == stage][['BU', 'Position', 'Request by', 'Status']], use_container_width=True)
+            st.dataframe(drill(datasets, index, "recruitment", 'Funnel Stage', stage)[['BU', 'Position', 'Request by', 'Status']], use_container_width=True)
         else:
             st.dataframe(df_rec[['BU', 'Position', 'Funnel Stage', 'Status']], use_container_width=True)
 
+        st.markdown("### 🎯 Interview Scores by Stage")
+        if aggs["interview_count"]:
+            st.dataframe(aggs["interview_funnel"], hide_index=True, use_container_width=True)
+        else:
+            st.caption("No filled interview evaluation forms found yet.")
+
 # --- EMPLOYEE MOVEMENT (SCROLLABLE & INTERACTIVE) ---
 elif menu == "Employee Movement":
+    from hr_analytics import charts
     c1, c2 = st.columns([3, 1])
     with c1: st.title("Workforce Dynamics")
     with c2: 
         if lottie_move: st_lottie(lottie_move, height=100, key="move")
 
-    # 1. DATA PREP
-    now = datetime.now()
-    
-    # A. New Joiners (Current Month)
-    joiners_df = pd.DataFrame()
-    if not df_active.empty and 'Joining Date' in df_active.columns:
-        joiners_df = df_active[
-            (df_active['Joining Date'].dt.month == now.month) & 
-            (df_active['Joining Date'].dt.year == now.year)
-        ].copy()
-        joiners_df['count'] = 1
-
-    # B. Leavers (ALL records)
-    leavers_df = df_inactive.copy() if not df_inactive.empty else pd.DataFrame()
-    if not leavers_df.empty: 
-        leavers_df['count'] = 1
-        leavers_df = leavers_df.sort_values('Exit Date', ascending=False) # Recent first
-
-    # C. Trend Data (Monthly Summary)
-    trend_df = pd.DataFrame()
-    if not df_inactive.empty and 'Exit Date' in df_inactive.columns:
-        df_inactive['ExitMonth'] = df_inactive['Exit Date'].dt.strftime('%Y-%m')
-        trend_df = df_inactive.groupby('ExitMonth').size().reset_index(name='Exits')
-        trend_df = trend_df.sort_values('ExitMonth')
+    # 1. DATA PREP (precomputed in the aggregate store)
+    joiners_df = aggs["joiners"]       # A. New Joiners (Current Month)
+    leavers_df = aggs["leavers"]       # B. Leavers (ALL records, recent first)
+    trend_df = aggs["exit_trend"]      # C. Trend Data (Monthly Summary)
 
     # 2. KPI METRICS
     k1, k2 = st.columns(2)
@@ -315,7 +337,7 @@ elif menu == "Employee Movement":
 
     st.markdown("---")
 
-    # 3. INTERACTIVE SECTION WITH SCROLLABLE CHARTS
+    # 3. INTERACTIVE SECTION WITH PAGED CHARTS
     col_left, col_right = st.columns([1, 1])
 
     # === LEFT: NEW JOINERS ===
@@ -330,38 +352,19 @@ elif menu == "Employee Movement":
 
         st.markdown("---") # Separator
 
-        # SCROLLABLE CHART CONTAINER
-        with st.container(height=400):
-            if not joiners_df.empty:
-                # Dynamic Height: 40px per person so it scrolls
-                h_join = max(300, len(joiners_df) * 40)
-                
-                fig_join = px.bar(joiners_df, x='count', y='Name', orientation='h', 
-                                  text='Name', color_discrete_sequence=[SECONDARY])
-                fig_join.update_layout(
-                    plot_bgcolor="white", paper_bgcolor="white", 
-                    font=dict(color=TEXT_COLOR),
-                    yaxis={'visible': True, 'showticklabels': False, 'title': ''},
-                    xaxis={'visible': False},
-                    showlegend=False,
-                    height=h_join,
-                    margin=dict(l=0, r=0, t=0, b=0)
-                )
-                fig_join.update_traces(textposition='inside', insidetextanchor='start')
-                
-                # INTERACTIVITY
-                sel_join = st.plotly_chart(fig_join, use_container_width=True, on_select="rerun")
-                
-                # UPDATE POP-UP
-                if sel_join and sel_join['selection']['points']:
-                    clicked_name = sel_join['selection']['points'][0]['y']
-                    person = joiners_df[joiners_df['Name'] == clicked_name].iloc[0]
-                    with detail_placeholder_join.container():
-                        st.info(f"👤 **{clicked_name}**")
-                        st.write(f"📅 Joined: **{person['Joining Date'].strftime('%d %b %Y')}**")
-                        st.write(f"👔 Reports To: **{person.get('Reporting To', 'N/A')}**")
-            else:
-                st.info("No new joiners this month.")
+        # PAGED CHART (only the visible window is built and sent)
+        if not joiners_df.empty:
+            clicked_name = paged_name_chart(joiners_df, aggs["joiners_lookup"], "join", SECONDARY)
+            person = lookup(datasets, index, "active", "Name", clicked_name) if clicked_name else None
+            
+            # UPDATE POP-UP
+            if person is not None:
+                with detail_placeholder_join.container():
+                    st.info(f"👤 **{clicked_name}**")
+                    st.write(f"📅 Joined: **{person['Joining Date'].strftime('%d %b %Y')}**")
+                    st.write(f"👔 Reports To: **{person.get('Reporting To', 'N/A')}**")
+        else:
+            st.info("No new joiners this month.")
         st.markdown('</div>', unsafe_allow_html=True)
 
     # === RIGHT: LEAVING EMPLOYEES (ALL) ===
@@ -376,119 +379,254 @@ elif menu == "Employee Movement":
 
         st.markdown("---") # Separator
 
-        # SCROLLABLE CHART CONTAINER
-        with st.container(height=400):
-            if not leavers_df.empty:
-                # Dynamic Height: Ensure ALL names fit by calculating height per person
-                h_leave = max(300, len(leavers_df) * 40)
-                
-                fig_leave = px.bar(leavers_df, x='count', y='Name', orientation='h',
-                                   text='Name', color_discrete_sequence=[DANGER])
-                fig_leave.update_layout(
-                    plot_bgcolor="white", paper_bgcolor="white", 
-                    font=dict(color=TEXT_COLOR),
-                    yaxis={'visible': True, 'showticklabels': False, 'title': ''}, # Hide Y axis text to save width
-                    xaxis={'visible': False},
-                    showlegend=False,
-                    height=h_leave, # TALL HEIGHT to fit everyone
-                    margin=dict(l=0, r=0, t=0, b=0)
-                )
-                fig_leave.update_traces(textposition='inside', insidetextanchor='start')
-                
-                # INTERACTIVITY
-                sel_leave = st.plotly_chart(fig_leave, use_container_width=True, on_select="rerun")
-                
-                # UPDATE POP-UP
-                if sel_leave and sel_leave['selection']['points']:
-                    clicked_leaver = sel_leave['selection']['points'][0]['y']
-                    leaver = leavers_df[leavers_df['Name'] == clicked_leaver].iloc[0]
-                    with detail_placeholder_leave.container():
-                        st.error(f"👤 **{clicked_leaver}**")
-                        reason = leaver.get('Reason', 'Not Mentioned')
-                        st.write(f"❓ Reason: **{reason}**")
-                        exit_d = leaver.get('Exit Date', pd.NaT)
-                        d_str = exit_d.strftime('%d %b %Y') if pd.notnull(exit_d) else "N/A"
-                        st.write(f"📅 Exit Date: **{d_str}**")
-            else:
-                st.success("No attrition records found.")
+        # PAGED CHART (only the visible window is built and sent)
+        if not leavers_df.empty:
+            clicked_leaver = paged_name_chart(leavers_df, aggs["leavers_lookup"], "leave", DANGER)
+            leaver = lookup(datasets, index, "inactive", "Name", clicked_leaver) if clicked_leaver else None
+            
+            # UPDATE POP-UP
+            if leaver is not None:
+                with detail_placeholder_leave.container():
+                    st.error(f"👤 **{clicked_leaver}**")
+                    reason = leaver.get('Reason', 'Not Mentioned')
+                    st.write(f"❓ Reason: **{reason}**")
+                    exit_d = leaver.get('Exit Date', pd.NaT)
+                    d_str = exit_d.strftime('%d %b %Y') if pd.notnull(exit_d) else "N/A"
+                    st.write(f"📅 Exit Date: **{d_str}**")
+        else:
+            st.success("No attrition records found.")
         st.markdown('</div>', unsafe_allow_html=True)
 
     # === BOTTOM: SUMMARY CHART ===
     st.markdown('<div class="chart-box">', unsafe_allow_html=True)
     st.subheader("📉 Attrition Overview (Monthly Trend)")
     if not trend_df.empty:
-        fig_trend = px.area(trend_df, x='ExitMonth', y='Exits', title="Monthly Exits", markers=True)
-        fig_trend.update_traces(line_color=DANGER, fillcolor="rgba(231, 76, 60, 0.2)")
-        fig_trend.update_layout(plot_bgcolor="white", paper_bgcolor="white", font=dict(color=TEXT_COLOR))
-        st.plotly_chart(fig_trend, use_container_width=True)
+        fig_trend = charts.exit_trend(trend_df)
+        show_chart(fig_trend, use_container_width=True)
     else:
         st.info("Not enough data for trend analysis.")
     st.markdown('</div>', unsafe_allow_html=True)
 
+    # === WORKFORCE TREND (any range, from cumulative join/exit counts) ===
+    st.markdown('<div class="chart-box">', unsafe_allow_html=True)
+    st.subheader("📈 Workforce Trend")
+    ev = aggs["workforce_events"]
+    if len(ev["starts"]):
+        first, today = pd.Timestamp(ev["starts"][0]).date(), now.date()
+        c_range, c_freq = st.columns([3, 1])
+        picked = c_range.date_input("Date range", (max(first, (now - pd.DateOffset(months=24)).date()), today),
+                                    min_value=first, max_value=today, key="wf_range")
+        freq = c_freq.selectbox("Granularity", list(timeseries.FREQUENCIES), index=2, key="wf_freq")
+        start, end = picked if len(picked) == 2 else (picked[0], today)
+
+        if freq == "Monthly":
+            # the aggregate store keeps the full monthly history; just slice it
+            series = aggs["workforce_monthly"].loc[pd.Timestamp(start).replace(day=1):pd.Timestamp(end)]
+        else:
+            series = timeseries.series(ev, start, end, timeseries.FREQUENCIES[freq])
+        show_chart(charts.headcount_trend(series), use_container_width=True)
+
+        c1, c2 = st.columns(2)
+        with c1:
+            show_chart(charts.attrition_trend(series), use_container_width=True)
+        with c2:
+            as_of = pd.Timestamp(end) + pd.Timedelta(days=1)  # end of the last selected day
+            st.markdown(f"**Tenure on {end:%d %b %Y}**")
+            show_chart(charts.tenure_bands(timeseries.tenure_bands(ev, as_of)), use_container_width=True)
+        st.markdown("**Joining Cohorts**")
+        st.dataframe(timeseries.cohorts(ev, as_of), hide_index=True, use_container_width=True)
+    else:
+        st.info("No joining dates to build a trend from.")
+    st.markdown('</div>', unsafe_allow_html=True)
+
 # --- ORG STRUCTURE ---
 elif menu == "Organization Structure":
+    from hr_analytics import charts
     st.title("🏢 Interactive Hierarchy")
     if not df_active.empty:
         st.info("Click segments to drill down.")
-        path = []
-        if 'Business Unit' in df_active.columns: path.append('Business Unit')
-        if 'Department' in df_active.columns: path.append('Department')
-        if 'Designation' in df_active.columns: path.append('Designation')
+        path = aggs["org_path"]
         
         if path:
-            df_tree = df_active.groupby(path).size().reset_index(name='Count')
-            fig = px.sunburst(df_tree, path=path, values='Count', color='Business Unit', height=600)
-            fig.update_layout(plot_bgcolor="white", paper_bgcolor="white", font=dict(color=TEXT_COLOR))
-            st.plotly_chart(fig, use_container_width=True, on_select="rerun")
+            fig = charts.org_sunburst(aggs["org_tree"], path)
+            show_chart(fig, use_container_width=True, on_select="rerun")
             
             st.subheader("Reporting Matrix")
-            cols = ['Name', 'Designation', 'Business Unit', 'Reporting To']
-            valid = [c for c in cols if c in df_active.columns]
-            st.dataframe(df_active[valid].sort_values('Reporting To'), use_container_width=True)
+            st.dataframe(aggs["reporting"], use_container_width=True)
+
+        # Reporting lines are resolved once per roster version (hr_analytics.orggraph);
+        # picking a manager slices the prebuilt tree and reuses its cached team table.
+        graph, managers, orphans = aggs["org_graph"], aggs["managers"], aggs["orphans"]
+        if len(managers):
+            st.subheader("🧭 Reporting Lines")
+            c1, c2, c3, c4 = st.columns(4)
+            c1.metric("Managers", int((managers['Kind'] == "Employee").sum()))
+            c2.metric("Deepest Level", int(graph.depth.max()))
+            c3.metric("Without Manager on Roster", len(orphans))
+            c4.metric("Reporting Loops", len(graph.cycles))
+
+            sizes = dict(zip(managers['Name'], managers['Team Size']))
+            boss = st.selectbox("Manager", managers['Name'], key="org_manager",
+                                format_func=lambda n: f"{n} ({sizes[n]})")
+            node = graph.node(boss)
+            chain = [graph.names[p] for p in graph.chain(node)]
+            if chain: st.caption(" › ".join(chain + [boss]))
+            direct_only = st.toggle("Direct reports only", key="org_direct")
+            team = graph.team(node, df_active)
+            if direct_only: team = team[team['Level'] == 1]
+            cols = [c for c in ['Name', 'Designation', 'Business Unit', 'Manager', 'Level'] if c in team.columns]
+            st.dataframe(team[cols], hide_index=True, use_container_width=True)
+
+            if len(orphans) or graph.cycles:
+                with st.expander("⚠️ Reporting data issues"):
+                    for loop in graph.cycles:
+                        st.warning("Reporting loop: " + " → ".join(loop + loop[:1]))
+                    st.dataframe(orphans, hide_index=True, use_container_width=True)
 
 # --- PERFORMANCE & LEAVE ---
 elif menu == "Performance & Leave":
+    from hr_analytics import charts
     st.title("🚀 Performance & Leave Analytics")
     t1, t2 = st.tabs(["Performance", "Leave"])
     
     with t1:
         if not df_perf.empty:
-            avg = df_perf['Total Points (Out of 100)'].mean()
             c1, c2 = st.columns(2)
-            c1.metric("Avg Score", f"{avg:.1f}")
-            c2.metric("High Performers", len(df_perf[df_perf['Category'] == 'High Performer']))
+            c1.metric("Avg Score", f"{aggs['perf']['avg']:.1f}")
+            c2.metric("High Performers", aggs['perf']['high'])
             
             st.subheader("Performance Distribution")
-            cat_counts = df_perf['Category'].value_counts().reset_index()
-            cat_counts.columns = ['Category', 'Count']
-            fig = px.bar(cat_counts, x='Category', y='Count', color='Category', 
-                         color_discrete_map={'High Performer': '#2ECC71', 'Average': '#F1C40F', 'Low Performer': '#E74C3C'})
-            fig.update_layout(plot_bgcolor="white", paper_bgcolor="white", font=dict(color=TEXT_COLOR))
+            fig = charts.performance_distribution(aggs["perf_counts"])
             
-            sel = st.plotly_chart(fig, use_container_width=True, on_select="rerun")
+            sel = show_chart(fig, use_container_width=True, on_select="rerun")
             
             cat = None
             if sel and sel['selection']['points']:
                 cat = sel['selection']['points'][0]['x']
                 
             if cat:
-                st.dataframe(df_perf[df_perf['Category'] == cat], use_container_width=True)
+                st.dataframe(latest_period(drill(datasets, index, "performance", 'Category', cat)), use_container_width=True)
             else:
                 st.dataframe(df_perf, use_container_width=True)
 
     with t2:
         if not df_leave.empty:
-            st.metric("Total Leaves (YTD)", f"{df_leave['Total Availed'].sum():.0f}")
-            
+            # One row per employee and leave type (hr_analytics.leave); the
+            # per-type and per-employee views below are index drills on it.
+            years = aggs["leave_years"]
+            c1, c2, c3 = st.columns(3)
+            c1.metric("Total Leaves (YTD)", f"{aggs['leave_total']:.0f}")
+            c2.metric("Overdrawn Balances", aggs["leave_overdrawn"])
+            c3.metric("Leave Years", years['Period'].nunique() if not years.empty else 0)
+
+            if not aggs["leave_trend"].empty:
+                st.subheader("Monthly Leave Trend")
+                show_chart(charts.leave_trend(aggs["leave_trend"]), use_container_width=True)
+            if not years.empty and years['Period'].nunique() > 1:
+                st.subheader("Year over Year")
+                show_chart(charts.leave_years(years[years['Leave Type'].isin(leave.LEAVE_TYPES)]), use_container_width=True)
+
             st.subheader("Leave Balances")
-            bal_cols = [c for c in df_leave.columns if str(c).endswith('.2')]
-            valid = ['Employee Name', 'Total Availed'] + bal_cols
-            st.dataframe(df_leave[[c for c in valid if c in df_leave.columns]], use_container_width=True)
+            st.dataframe(aggs["leave_balances"], hide_index=True, use_container_width=True)
+
+            st.subheader("By Leave Type")
+            st.dataframe(aggs["leave_by_type"], hide_index=True, use_container_width=True)
+            leave_type = st.selectbox("Leave type", aggs["leave_by_type"]['Leave Type'], key="leave_type")
+            if leave_type:
+                by_type = latest_period(drill(datasets, index, "leave", 'Leave Type', leave_type))
+                st.dataframe(by_type.sort_values('Availed', ascending=False)[['Employee Name', 'Designation', 'Entitled', 'Availed', 'Balance']],
+                             hide_index=True, use_container_width=True)
+
+            st.subheader("🔍 Employee Ledger")
+            who = st.selectbox("Employee", sorted(index["groups"]["leave"].get('Employee Name', {})), index=None,
+                               placeholder="Select an employee", key="leave_employee")
+            if who:
+                history = drill(datasets, index, "leave", 'Employee Name', who)
+                st.dataframe(history[['Period', 'Leave Type', 'Entitled', 'Availed', 'Balance']], hide_index=True, use_container_width=True)
+                months = drill(datasets, index, "leave_monthly", 'Employee Name', who)
+                months = months[months['Leave Type'].isin(leave.LEAVE_TYPES)]
+                if not months.empty:
+                    show_chart(charts.leave_trend(months.assign(Month=leave.month_start(months))), use_container_width=True)
+
+# --- ATTENDANCE & HOURS ---
+elif menu == "Attendance & Hours":
+    from hr_analytics import charts
+    st.title("⏱️ Attendance & Working Hours")
+    df_hours = datasets.get("attendance", EMPTY)
+    if not df_hours.empty:
+        org_monthly = aggs["attendance_org_monthly"]
+        latest = org_monthly.iloc[-1]
+        k1, k2, k3, k4 = st.columns(4)
+        k1.metric(f"Tracked ({latest['Period']:%b %Y})", int(latest['Employees']))
+        k2.metric("Avg Hours / Worked Day", f"{latest['Avg Hours/Day']:.2f}")
+        k3.metric("WFH Share", f"{latest['WFH Share %']:.1f}%")
+        k4.metric("Leave Days", int(latest['Leave Days']))
+
+        st.markdown("---")
+        grain = st.radio("Granularity", ["Monthly", "Weekly"], horizontal=True, key="att_grain")
+        label = grain.lower()
+        show_chart(charts.attendance_trend(aggs[f"attendance_org_{label}"]), use_container_width=True)
+
+        # per-employee rollups are precomputed; a period is one slice of them
+        per_employee = aggs[f"attendance_{label}"]
+        periods = per_employee['Period'].drop_duplicates().sort_values(ascending=False)
+        period = st.selectbox("Period", periods, format_func=lambda p: f"{p:%b %Y}" if grain == "Monthly" else f"Week of {p:%d %b %Y}")
+        rows = per_employee[per_employee['Period'] == period].drop(columns='Period').sort_values('Hours', ascending=False)
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+
+        st.subheader("🔍 Employee Timeline")
+        names = sorted(df_hours['Employee Name'].unique())
+        who = st.selectbox("Employee", names, index=None, placeholder="Select an employee", key="att_employee")
+        if who:
+            daily = drill(datasets, index, "attendance", 'Employee Name', who)
+            show_chart(charts.employee_hours(daily), use_container_width=True)
+    else:
+        st.info("No working hours workbook found.")
 
 # --- POLICIES ---
 elif menu == "Policies & Docs":
     st.title("📜 Corporate Policies")
-    with st.expander("📄 Annual Increment Policy"):
-        st.info("Eligibility: Min 12 months service | Criteria: KPI & Profitability")
-    with st.expander("📄 Recruitment Policy"):
-        st.info("SLA: 30 Days to Hire | Process: Requisition > Panel > Offer")
\ No newline at end of file
+    # The search index is persisted in the cache dir and kept in memory per
+    # document version; a rerun only stats the .docx files.
+    policy_index = policies.policy_index(policies.document_versions())
+    query = st.text_input("🔍 Search policies", key="policy_query", placeholder="e.g. sick leave during probation")
+    if query:
+        hits = policy_index.search(query, limit=10)
+        if hits:
+            st.caption(f"{len(hits)} passages from {len({h['Document'] for h in hits})} of {len(policy_index.documents)} documents")
+            for h in hits:
+                st.markdown(f"**📄 {h['Document']}**")
+                st.markdown(policies.snippet(h["Passage"], h["Terms"], mark=(":orange-background[", "]"), escape=md_escape))
+        else:
+            st.caption("No passages match the search.")
+    else:
+        st.caption(f"{len(policy_index)} passages indexed across: " + ", ".join(policy_index.documents))
+        with st.expander("📄 Annual Increment Policy"):
+            st.info("Eligibility: Min 12 months service | Criteria: KPI & Profitability")
+        with st.expander("📄 Recruitment Policy"):
+            st.info("SLA: 30 Days to Hire | Process: Requisition > Panel > Offer")
+telemetry.record(f"page.{menu}", page_start)
+
+# ==============================================================================
+# 5. ADMIN TIMING PANEL
+# ==============================================================================
+# Set HR_ADMIN=1 to show where this rerun's time went. Every rerun is also
+# logged as one JSON line when HR_TELEMETRY_LOG is set (see hr_analytics.telemetry).
+if os.environ.get("HR_ADMIN") == "1":
+    report = run.to_dict()
+    with st.sidebar.expander("⏱ Rerun Timings"):
+        st.metric("This rerun", f"{report['total_ms']:.0f} ms")
+        spans = pd.DataFrame(report["spans"], columns=["name", "offset_ms", "ms", "depth"]).sort_values("offset_ms")
+        spans["name"] = ["· " * d + n for n, d in zip(spans["name"], spans["depth"])]
+        st.dataframe(spans[["name", "ms"]], hide_index=True, use_container_width=True)
+        counters = telemetry.totals()
+        memos = sorted({k.split(".", 2)[2] for k in counters if k.startswith("cache.")})
+        cache = pd.DataFrame([(m, counters.get(f"cache.hit.{m}", 0), counters.get(f"cache.miss.{m}", 0)) for m in memos] +
+                             [("snapshot files", counters.get("snapshot.hit", 0), counters.get("snapshot.miss", 0))],
+                             columns=["cache", "hits", "misses"])
+        st.caption("Cache hits / misses since the server started")
+        st.dataframe(cache, hide_index=True, use_container_width=True)
+        st.download_button("Download JSON", json.dumps({**report, "totals": counters}, indent=2),
+                           file_name="hr_dashboard_timings.json", mime="application/json")
+
+telemetry.emit(run)
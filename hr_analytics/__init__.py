@@ -0,0 +1,27 @@
+"""Data loading and KPI logic behind the HR dashboard, usable without Streamlit.
+
+The Streamlit app, the JSON API (``python -m hr_analytics serve``) and batch
+exports all read through these functions, so one warm process parses each
+workbook once per change.
+"""
+from .aggregates import FUNNEL_ORDER, build_aggregates
+from .api import current_state
+from .index import build_index, drill, lookup
+from .ingest import SOURCES, data_versions, discover, latest_period, load_data
+from .snapshot import file_fingerprint, read_sheet
+
+__all__ = [
+    "FUNNEL_ORDER",
+    "SOURCES",
+    "build_aggregates",
+    "build_index",
+    "current_state",
+    "data_versions",
+    "discover",
+    "drill",
+    "file_fingerprint",
+    "latest_period",
+    "load_data",
+    "lookup",
+    "read_sheet",
+]
@@ -0,0 +1,62 @@
+"""Command line entry point.
+
+    python -m hr_analytics export overview      # print one page's numbers as JSON
+    python -m hr_analytics export all -o out.json
+    python -m hr_analytics serve --port 8765    # GET /api/<view>
+    python -m hr_analytics refresh --watch 30   # publish datasets to $HR_SHARED_DIR
+"""
+import argparse
+import sys
+
+from . import api
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="hr_analytics", description="Falkenherz HR analytics without the Streamlit UI.")
+    parser.add_argument("--data-dir", help="folder holding the workbooks (default: $HR_DATA_DIR or cwd)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_export = sub.add_parser("export", help="print a page's numbers as JSON")
+    p_export.add_argument("view", choices=sorted(api.VIEWS) + ["all", "versions"])
+    p_export.add_argument("-o", "--output", help="write to this file instead of stdout")
+
+    p_serve = sub.add_parser("serve", help="serve /api/<view> over HTTP")
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=8765)
+
+    p_refresh = sub.add_parser("refresh", help="publish parsed datasets to the shared data tier")
+    p_refresh.add_argument("--shared-dir", help="where to publish (default: $HR_SHARED_DIR)")
+    p_refresh.add_argument("--watch", type=float, metavar="SECONDS", help="keep polling the workbooks at this interval")
+
+    args = parser.parse_args(argv)
+    if args.data_dir:
+        from . import ingest
+        ingest.DATA_DIR = args.data_dir
+
+    if args.command == "refresh":
+        from . import shared
+        shared_dir = args.shared_dir or shared.SHARED_DIR
+        if not shared_dir: parser.error("refresh needs --shared-dir or $HR_SHARED_DIR")
+        if args.watch:
+            print(f"Publishing to {shared_dir} every {args.watch:g}s", file=sys.stderr)
+            shared.watch(args.watch, shared_dir, log=lambda msg: print(msg, file=sys.stderr))
+        else:
+            written = shared.refresh(shared_dir)
+            print(f"published {', '.join(written)}" if written else "up to date", file=sys.stderr)
+        return 0
+
+    if args.command == "serve":
+        print(f"Serving on http://{args.host}:{args.port}/api/", file=sys.stderr)
+        api.serve(args.host, args.port)
+        return 0
+
+    out = api.to_json(api.view(args.view), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f: f.write(out + "\n")
+    else:
+        print(out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""Worker entry point for ingest's parallel workbook parses.
+
+    python -m hr_analytics._ingest_worker < task.pickle > frames.pickle
+
+The task is (path, [(dataset, fingerprint), ...], snapshot dir); the reply is
+{dataset: frame}, with None for frames written to a snapshot, which the
+parent maps from disk. Each worker is its own interpreter started on this
+module, so the dashboard script (Streamlit's __main__) is never re-imported
+and nothing process-wide in the server has to change to start one.
+"""
+import pickle
+import sys
+
+from . import snapshot
+from .loaders import LOADERS, is_snapshotted
+
+
+def parse_workbook(path, shards, snapshot_dir):
+    """Runs every loader that reads path, so shared parses (leave) happen once."""
+    snapshot.SNAPSHOT_DIR = snapshot_dir
+    frames = {name: LOADERS[name](path, fp) for name, fp in shards}
+    return {name: None if is_snapshotted(name, fp) else frames[name] for name, fp in shards}
+
+
+def main():
+    path, shards, snapshot_dir = pickle.load(sys.stdin.buffer)
+    out, sys.stdout = sys.stdout.buffer, sys.stderr  # stray prints must not corrupt the reply
+    pickle.dump(parse_workbook(path, shards, snapshot_dir), out, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""Aggregate store: every KPI and chart series, materialized once per data version.
+
+Aggregates are built in sections, each keyed only on the versions of the
+datasets it reads (the movement section also on the calendar month), so a
+page can ask for just its sections and changing one workbook only rebuilds
+the sections that read it. Chart clicks trigger a rerun, and those reruns
+read from here instead of re-aggregating frames.
+"""
+import numpy as np
+import pandas as pd
+
+from . import attendance, interviews, leave, orggraph, timeseries
+from .cache import versioned
+from .ingest import latest_period, period_key
+
+FUNNEL_ORDER = ['Applied', 'Shortlisted', 'Interview', 'Offer Extended', 'Hired']
+
+
+def name_lookup(df):
+    """Name -> row positions, plus lower-cased names for substring search."""
+    if 'Name' not in df.columns: return {"positions": {}, "lower": np.array([], dtype=object)}
+    names = df['Name'].astype(str)
+    return {"positions": names.groupby(names.to_numpy(), sort=False).indices, "lower": names.str.lower().to_numpy()}
+
+
+def _headcount(data, month):
+    df_active, df_inactive = data["active"], data["inactive"]
+    aggs = {}
+    total = len(df_active) + len(df_inactive)
+    aggs["headcount"] = {
+        "total": total,
+        "active": len(df_active),
+        "exited": len(df_inactive),
+        "retention": (len(df_active) / total * 100) if total else 0,
+        "probation": int(df_active['Employment Status'].str.contains('Probation', case=False).sum()) if 'Employment Status' in df_active.columns else 0,
+    }
+    bu_counts = pd.DataFrame(columns=['Business Unit', 'Count'])
+    if 'Business Unit' in df_active.columns:
+        bu_counts = df_active['Business Unit'].value_counts().reset_index()
+        bu_counts.columns = ['Business Unit', 'Count']
+    aggs["bu_counts"] = bu_counts
+    return aggs
+
+
+def _recruitment(data, month):
+    df_rec = data["recruitment"]
+    aggs = {}
+    funnel = pd.DataFrame(columns=['Stage', 'Count'])
+    hired = 0
+    if 'Funnel Stage' in df_rec.columns:
+        funnel = df_rec['Funnel Stage'].value_counts().reset_index()
+        funnel.columns = ['Stage', 'Count']
+        funnel['Stage'] = pd.Categorical(funnel['Stage'], categories=FUNNEL_ORDER, ordered=True)
+        funnel = funnel.sort_values('Stage')
+        hired = int((df_rec['Funnel Stage'] == 'Hired').sum())
+    aggs["funnel"] = funnel
+    aggs["pipeline"] = {"total": len(df_rec), "open": len(df_rec) - hired, "hired": hired}
+    return aggs
+
+
+def _movement(data, month):
+    df_active, df_inactive = data["active"], data["inactive"]
+    aggs = {}
+    joiners_df = pd.DataFrame()
+    if 'Joining Date' in df_active.columns:
+        start = pd.Timestamp(*month, 1)
+        joined = df_active['Joining Date']
+        joiners_df = df_active[(joined >= start) & (joined < start + pd.offsets.MonthBegin(1))].copy()
+        joiners_df['count'] = 1
+    aggs["joiners"] = joiners_df
+
+    leavers_df = pd.DataFrame()
+    if not df_inactive.empty:
+        leavers_df = df_inactive.copy()
+        leavers_df['count'] = 1
+        if 'Exit Date' in leavers_df.columns:
+            leavers_df = leavers_df.sort_values('Exit Date', ascending=False) # Recent first
+    aggs["leavers"] = leavers_df
+    aggs["joiners_lookup"] = name_lookup(joiners_df)
+    aggs["leavers_lookup"] = name_lookup(leavers_df)
+
+    trend_df = pd.DataFrame()
+    if 'Exit Date' in df_inactive.columns:
+        trend_df = df_inactive.groupby(df_inactive['Exit Date'].dt.strftime('%Y-%m').rename('ExitMonth')).size().reset_index(name='Exits')
+        trend_df = trend_df.sort_values('ExitMonth')
+    aggs["exit_trend"] = trend_df
+    return aggs
+
+
+def _org(data, month):
+    df_active = data["active"]
+    aggs = {}
+    path = [c for c in ['Business Unit', 'Department', 'Designation'] if c in df_active.columns]
+    aggs["org_path"] = path
+    org_tree = pd.DataFrame()
+    if path:
+        org_tree = df_active.groupby(path, observed=True).size().reset_index(name='Count')
+        org_tree = org_tree.astype({c: object for c in path})  # px.sunburst can't take categoricals
+    aggs["org_tree"] = org_tree
+    reporting_cols = [c for c in ['Name', 'Designation', 'Business Unit', 'Reporting To'] if c in df_active.columns]
+    aggs["reporting"] = df_active[reporting_cols].sort_values('Reporting To') if 'Reporting To' in reporting_cols else df_active[reporting_cols]
+    # resolved once per roster version; manager drill-downs slice this graph
+    graph = orggraph.build_graph(df_active)
+    aggs["org_graph"] = graph
+    aggs["managers"] = graph.managers()
+    aggs["orphans"] = graph.orphans()
+    return aggs
+
+
+def _performance(data, month):
+    # review cycles don't add up, so these KPIs use the latest period
+    df_perf = latest_period(data["performance"])
+    aggs = {}
+    perf_counts = pd.DataFrame(columns=['Category', 'Count'])
+    aggs["perf"] = {"avg": float('nan'), "high": 0}
+    if 'Category' in df_perf.columns:
+        perf_counts = df_perf['Category'].value_counts().reset_index()
+        perf_counts.columns = ['Category', 'Count']
+        aggs["perf"] = {
+            "avg": df_perf['Total Points (Out of 100)'].mean(),
+            "high": int((df_perf['Category'] == 'High Performer').sum()),
+        }
+    aggs["perf_counts"] = perf_counts
+    return aggs
+
+
+def _leave(data, month):
+    ledger, monthly = data["leave"], data["leave_monthly"]
+    aggs = {}
+    if ledger.empty or 'Leave Type' not in ledger.columns:
+        aggs["leave_total"] = 0.0
+        aggs["leave_overdrawn"] = 0
+        for key in ("leave_balances", "leave_by_type", "leave_years", "leave_trend"): aggs[key] = pd.DataFrame()
+        return aggs
+    # nor do leave years
+    latest = latest_period(ledger)
+    is_leave = latest['Leave Type'].isin(leave.LEAVE_TYPES)
+    aggs["leave_total"] = float(latest.loc[is_leave, 'Availed'].sum())
+    aggs["leave_overdrawn"] = int((latest.loc[is_leave, 'Balance'] < 0).sum())
+    balances = latest.pivot_table(index='Employee Name', columns='Leave Type', values='Balance', observed=True, sort=False)
+    totals = latest[is_leave].groupby('Employee Name', observed=True, sort=False)['Availed'].sum().rename('Total Availed')
+    aggs["leave_balances"] = pd.concat([totals, balances], axis=1).rename_axis('Employee Name').reset_index()
+    aggs["leave_by_type"] = (latest.groupby('Leave Type', observed=True)[['Entitled', 'Availed', 'Balance']].sum(min_count=1)
+                             .assign(Employees=latest.groupby('Leave Type', observed=True)['Employee Name'].nunique())
+                             .reset_index())
+    # cross-year: availed days per type in every Leave Record period
+    years = ledger.groupby(['Period', 'Leave Type'], observed=True)['Availed'].sum().reset_index()
+    order = {p: i for i, p in enumerate(sorted(years['Period'].unique(), key=period_key))}
+    aggs["leave_years"] = years.sort_values('Period', key=lambda s: s.map(order), kind='stable', ignore_index=True)
+    trend = pd.DataFrame()
+    if not monthly.empty:
+        taken = monthly[monthly['Leave Type'].isin(leave.LEAVE_TYPES)]
+        # sum per period and month first; dating the few resulting rows is cheap
+        trend = taken.groupby(['Period', 'Month', 'Leave Type'], observed=True)['Days'].sum().reset_index()
+        trend = (trend.assign(Month=leave.month_start(trend)).groupby(['Month', 'Leave Type'], observed=True)['Days'].sum()
+                 .reset_index().sort_values(['Month', 'Leave Type'], ignore_index=True))
+    aggs["leave_trend"] = trend
+    return aggs
+
+
+def _workforce(data, month):
+    ev = timeseries.events(data["active"], data["inactive"])
+    return {"workforce_events": ev, "workforce_monthly": timeseries.monthly(ev, month)}
+
+
+def _attendance(data, month):
+    daily = data["attendance"]
+    aggs = {}
+    for label, freq in (("weekly", "W"), ("monthly", "M")):
+        per_employee = attendance.rollup(daily, freq)
+        aggs[f"attendance_{label}"] = per_employee
+        aggs[f"attendance_org_{label}"] = attendance.org_rollup(per_employee)
+    return aggs
+
+
+def _interviews(data, month):
+    summary, joined = interviews.funnel_scores(data["recruitment"], data["interviews"])
+    if not summary.empty:
+        summary['Stage'] = pd.Categorical(summary['Stage'], categories=FUNNEL_ORDER, ordered=True)
+        summary = summary.sort_values('Stage')
+    return {"interview_funnel": summary, "interview_count": len(data["interviews"]), "recruitment_scores": joined}
+
+
+# section -> (datasets it reads, builder, keyed on the month)
+SECTIONS = {
+    "headcount": (("active", "inactive"), _headcount, False),
+    "recruitment": (("recruitment",), _recruitment, False),
+    "movement": (("active", "inactive"), _movement, True),
+    "workforce": (("active", "inactive"), _workforce, True),
+    "org": (("active",), _org, False),
+    "performance": (("performance",), _performance, False),
+    "leave": (("leave", "leave_monthly"), _leave, False),
+    "attendance": (("attendance",), _attendance, False),
+    "interviews": (("recruitment", "interviews"), _interviews, False),
+}
+
+
+def section_datasets(sections):
+    """Datasets the given sections read, without repeats."""
+    datasets = []
+    for section in sections:
+        datasets += [d for d in SECTIONS[section][0] if d not in datasets]
+    return datasets
+
+
+@versioned(max_entries=2 * len(SECTIONS))
+def build_section(section, versions, month, _data):
+    """One section's aggregates; versions and _data cover just that section's datasets."""
+    return SECTIONS[section][1](_data, month)
+
+
+def build_aggregates(versions, month, data, sections=None):
+    """Aggregates of sections (default: every section whose datasets are all in data), merged into one dict."""
+    if sections is None: sections = [s for s, (needs, _, _) in SECTIONS.items() if all(d in data for d in needs)]
+    aggs = {}
+    for section in sections:
+        needs, _, by_month = SECTIONS[section]
+        aggs.update(build_section(section, {d: versions.get(d, ()) for d in needs},
+                                  month if by_month else None, {d: data[d] for d in needs}))
+    return aggs
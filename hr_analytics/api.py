@@ -0,0 +1,202 @@
+"""JSON views of the dashboard pages, plus a small local HTTP server.
+
+Every view returns the same numbers the matching Streamlit page shows, built
+from the shared (memoized) loaders, index and aggregate store.
+"""
+import json
+import math
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+from . import telemetry
+from .aggregates import build_aggregates, section_datasets
+from .index import build_index, drill
+from .ingest import DATASETS, data_versions, load_data
+
+
+def current_state(now=None, sections=None):
+    """{"versions", "data", "index", "aggs", "now"} for the current data version.
+
+    With sections (names from aggregates.SECTIONS) only the datasets those
+    sections read are loaded, indexed and aggregated; an empty list loads nothing.
+    """
+    now = now or datetime.now()
+    datasets = DATASETS if sections is None else section_datasets(sections)
+    versions, data = {}, {}
+    if datasets:
+        with telemetry.span("ingest.data_versions"):
+            versions = data_versions()
+        with telemetry.span("ingest.load_data"):
+            data = load_data(versions, datasets)
+    return {
+        "versions": versions,
+        "data": data,
+        "index": build_index(versions, data),
+        "aggs": build_aggregates(versions, (now.year, now.month), data, sections),
+        "now": now,
+    }
+
+
+def records(df):
+    return json.loads(df.to_json(orient="records", date_format="iso")) if not df.empty else []
+
+
+def overview(state):
+    aggs = state["aggs"]
+    return {"headcount": aggs["headcount"], "bu_counts": records(aggs["bu_counts"]), "perf_counts": records(aggs["perf_counts"])}
+
+
+SCORE_COLUMNS = ["BU", "Position", "Funnel Stage", "Status", "Office", "Period",
+                 "Interviewed", "Avg Interview Score", "Recommended Hire"]
+
+
+def recruitment(state):
+    aggs = state["aggs"]
+    scores = aggs["recruitment_scores"]
+    return {"pipeline": aggs["pipeline"], "funnel": records(aggs["funnel"]), "interviews": records(aggs["interview_funnel"]),
+            "requisition_scores": records(scores[[c for c in SCORE_COLUMNS if c in scores.columns]])}
+
+
+def movement(state):
+    aggs = state["aggs"]
+    return {
+        "month": state["now"].strftime("%Y-%m"),
+        "joiners": len(aggs["joiners"]),
+        "attrition": len(state["data"]["inactive"]),
+        "joiner_names": aggs["joiners"]["Name"].tolist() if "Name" in aggs["joiners"].columns else [],
+        "exit_trend": records(aggs["exit_trend"]),
+        "workforce": records(aggs["workforce_monthly"].tail(24).reset_index()),
+    }
+
+
+def org(state):
+    aggs = state["aggs"]
+    return {
+        "path": aggs["org_path"],
+        "tree": records(aggs["org_tree"]),
+        "reporting": records(aggs["reporting"]),
+        "managers": records(aggs["managers"]),
+        "orphans": records(aggs["orphans"]),
+        "cycles": aggs["org_graph"].cycles,
+        "max_depth": int(aggs["org_graph"].depth.max()) if len(aggs["org_graph"]) else 0,
+    }
+
+
+def performance(state):
+    aggs = state["aggs"]
+    return {
+        "perf": aggs["perf"],
+        "perf_counts": records(aggs["perf_counts"]),
+        "leave_total": aggs["leave_total"],
+        "leave_balances": records(aggs["leave_balances"]),
+        "leave_by_type": records(aggs["leave_by_type"]),
+        "leave_years": records(aggs["leave_years"]),
+        "leave_trend": records(aggs["leave_trend"]),
+    }
+
+
+def attendance(state):
+    aggs = state["aggs"]
+    return {
+        "monthly": records(aggs["attendance_org_monthly"]),
+        "weekly": records(aggs["attendance_org_weekly"]),
+    }
+
+
+VIEWS = {
+    "overview": overview,
+    "recruitment": recruitment,
+    "movement": movement,
+    "org": org,
+    "performance": performance,
+    "attendance": attendance,
+}
+# aggregate sections each view reads
+VIEW_SECTIONS = {
+    "overview": ["headcount", "performance"],
+    "recruitment": ["recruitment", "interviews"],
+    "movement": ["movement", "workforce"],
+    "org": ["org"],
+    "performance": ["performance", "leave"],
+    "attendance": ["attendance"],
+}
+
+
+def _default(value):
+    if isinstance(value, np.generic): return value.item()
+    if isinstance(value, pd.DataFrame): return records(value)
+    if isinstance(value, (pd.Timestamp, datetime)): return value.isoformat()
+    raise TypeError(f"not JSON serializable: {type(value).__name__}")
+
+
+def _clean(value):
+    if isinstance(value, dict): return {k: _clean(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)): return [_clean(v) for v in value]
+    if isinstance(value, float) and math.isnan(value): return None
+    return value
+
+
+def to_json(payload, indent=None):
+    return json.dumps(_clean(payload), default=_default, indent=indent)
+
+
+def view(name, state=None):
+    if name == "versions":  # file fingerprints only; nothing needs loading
+        versions = state["versions"] if state else data_versions()
+        return {k: [{"path": path, "office": office, "period": period, "mtime_ns": fp[1], "size": fp[2]}
+                    for path, office, period, fp in shards] for k, shards in versions.items()}
+    state = state or current_state(sections=VIEW_SECTIONS.get(name))
+    if name == "all":
+        return {k: fn(state) for k, fn in VIEWS.items()}
+    return VIEWS[name](state)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        run = telemetry.start_run(self.path)
+        try:
+            self._get()
+        finally:
+            telemetry.emit(run)
+
+    def _get(self):
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        try:
+            if len(parts) == 2 and parts[0] == "api" and parts[1] == "drill":
+                q = {k: v[0] for k, v in parse_qs(url.query).items()}
+                state = current_state()
+                payload = records(drill(state["data"], state["index"], q["dataset"], q["column"], q["value"]))
+            elif len(parts) == 2 and parts[0] == "api" and (parts[1] in VIEWS or parts[1] in ("all", "versions")):
+                payload = view(parts[1])
+            else:
+                return self._send(404, {"error": "not found", "views": sorted(VIEWS) + ["all", "versions", "drill"]})
+        except KeyError as e:
+            return self._send(400, {"error": f"missing parameter {e}"})
+        self._send(200, payload)
+
+    def _send(self, status, payload):
+        body = to_json(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host="127.0.0.1", port=8765):
+    """Serves /api/<view> as JSON until interrupted."""
+    server = ThreadingHTTPServer((host, port), _Handler)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
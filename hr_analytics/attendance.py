@@ -0,0 +1,140 @@
+"""Daily working hours: chunked ingest into a long columnar store, plus rollups.
+
+"Staff Working Hours" workbooks hold one sheet per month: a weekday header
+row, a row of dates, then one row per employee whose day cells are either
+the hours worked (a time of day such as 8:30) or a status code (SL, WFH,
+Holiday, ...). Each month sheet is streamed and turned into a compact frame
+right away (categorical names and statuses, float32 hours), one row per
+employee-day that has an entry, so a year of days never exists as a grid of
+Python objects. Report and raw punch sheets are skipped.
+"""
+import re
+from datetime import datetime, time, timedelta
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+# statuses, checked in order against the upper-cased cell text; the first matching regex wins
+STATUS_RULES = [
+    ("Holiday", r"HOL|HOIDAY|KASHMIR|EID"),
+    ("WFH", r"^WFH?$"),
+    ("Present", r"^P$"),
+    ("No Record", r"^(?:NR|NO RECORD|N/?A|#N/A|-)$"),
+]
+LEAVE_STATUS = "Leave"  # any other code (SL, CL, AL, LWP, COMP-L, ...)
+WORKED_STATUS = "Worked"
+STATUSES = [WORKED_STATUS, "WFH", "Present", LEAVE_STATUS, "Holiday", "No Record"]
+ON_DUTY = [WORKED_STATUS, "WFH", "Present"]
+
+_TYPED_TIME = re.compile(r"^(\d{1,2})\s*[:;.]\s*(\d{2})")  # "8;45", "09:16::00"
+
+
+def _hours(value):
+    """Hours in a time/timedelta cell (or a typed "h:mm" string), else None."""
+    if isinstance(value, time): return value.hour + value.minute / 60 + value.second / 3600
+    if isinstance(value, timedelta): return value.total_seconds() / 3600
+    if isinstance(value, str):
+        m = _TYPED_TIME.match(value.strip())
+        if m: return int(m.group(1)) + int(m.group(2)) / 60
+    return None
+
+
+def classify_status(codes):
+    """Status for each upper-cased code, by STATUS_RULES (LEAVE_STATUS when none match)."""
+    s = pd.Series(codes, dtype=object).str.strip().str.upper()
+    conditions = [s.str.contains(pattern, regex=True).fillna(False).to_numpy(dtype=bool) for _, pattern in STATUS_RULES]
+    return np.select(conditions, [label for label, _ in STATUS_RULES], default=LEAVE_STATUS)
+
+
+def _month_chunk(rows):
+    """Long frame for one month sheet's rows, or None when it isn't a month sheet."""
+    header = next(rows, None)
+    dates = next(rows, None)
+    if not header or not dates or "Employee Name" not in header: return None
+    name_col = header.index("Employee Name")
+    day_cols = [i for i, v in enumerate(dates) if isinstance(v, datetime)]
+    if not day_cols: return None
+    day_dates = np.array([dates[i] for i in day_cols], dtype="datetime64[ns]")
+
+    names, days, hours, codes = [], [], [], []
+    for row in rows:
+        if len(row) <= name_col or not isinstance(row[name_col], str) or not row[name_col].strip(): continue
+        name = row[name_col].strip()
+        for d, i in enumerate(day_cols):
+            if i >= len(row) or row[i] is None: continue
+            h = _hours(row[i])
+            names.append(name)
+            days.append(d)
+            hours.append(np.nan if h is None else h)
+            codes.append(None if h is not None else str(row[i]))
+    if not names: return None
+
+    codes = np.array(codes, dtype=object)
+    status = np.full(len(codes), WORKED_STATUS, dtype=object)
+    coded = np.array([c is not None for c in codes])
+    status[coded] = classify_status(codes[coded])
+    code = pd.Series(codes, dtype=object).str.strip().str.upper()
+    return pd.DataFrame({
+        "Employee Name": pd.Categorical(names),
+        "Date": day_dates[days],
+        "Hours": np.array(hours, dtype="float32"),
+        "Status": pd.Categorical(status, categories=STATUSES),
+        "Code": pd.Categorical(code.where(status == LEAVE_STATUS)),
+    })
+
+
+def read_hours(path):
+    """Every month sheet of a working-hours workbook as one long frame sorted by employee and date."""
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        chunks = []
+        for ws in wb.worksheets:
+            ws.reset_dimensions()
+            chunk = _month_chunk(ws.iter_rows(values_only=True))
+            if chunk is not None: chunks.append(chunk)
+    finally:
+        wb.close()
+    if not chunks: return None
+    # union_categoricals keeps names/codes categorical across the month chunks
+    df = pd.DataFrame({
+        col: pd.api.types.union_categoricals([c[col] for c in chunks]) if isinstance(chunks[0][col].dtype, pd.CategoricalDtype)
+        else np.concatenate([c[col].to_numpy() for c in chunks])
+        for col in chunks[0].columns
+    })
+    df["Status"] = df["Status"].cat.set_categories(STATUSES)
+    # a date kept on two sheets (e.g. a re-issued month) counts once, from the later sheet
+    df = df.drop_duplicates(["Employee Name", "Date"], keep="last")
+    return df.sort_values(["Employee Name", "Date"], ignore_index=True)
+
+
+def rollup(df, freq):
+    """Per employee and period ("W" or "M"): hours, days on duty/worked/WFH/leave, average hours per worked day."""
+    if df.empty: return pd.DataFrame(columns=["Employee Name", "Period", "Hours", "Days On Duty", "WFH Days", "Leave Days", "Worked Days", "Avg Hours/Day"])
+    period = df["Date"].dt.to_period(freq).dt.start_time.rename("Period")
+    status = df["Status"]
+    parts = pd.DataFrame({
+        "Hours": df["Hours"].fillna(0).astype("float64"),
+        "Days On Duty": status.isin(ON_DUTY),
+        "WFH Days": status.eq("WFH"),
+        "Leave Days": status.eq(LEAVE_STATUS),
+        "Worked Days": status.eq(WORKED_STATUS),
+    })
+    out = parts.groupby([df["Employee Name"], period], observed=True, sort=True).sum()
+    out["Avg Hours/Day"] = (out["Hours"] / out["Worked Days"].where(out["Worked Days"] > 0)).round(2)
+    out["Hours"] = out["Hours"].round(2)
+    return out.astype({c: "int32" for c in ["Days On Duty", "WFH Days", "Leave Days", "Worked Days"]}).reset_index()
+
+
+def org_rollup(per_employee):
+    """Whole-organisation totals per period from a rollup() frame."""
+    if per_employee.empty: return pd.DataFrame(columns=["Period", "Employees", "Hours", "Avg Hours/Day", "WFH Share %", "Leave Days"])
+    g = per_employee.groupby("Period", sort=True)
+    out = pd.DataFrame({
+        "Employees": g["Employee Name"].nunique(),
+        "Hours": g["Hours"].sum().round(1),
+        "Avg Hours/Day": (g["Hours"].sum() / g["Worked Days"].sum().where(lambda s: s > 0)).round(2),
+        "WFH Share %": (g["WFH Days"].sum() / g["Days On Duty"].sum().where(lambda s: s > 0) * 100).round(1),
+        "Leave Days": g["Leave Days"].sum(),
+    })
+    return out.reset_index()
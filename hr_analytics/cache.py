@@ -0,0 +1,72 @@
+"""In-process memo for functions of data versions.
+
+Results are keyed on file fingerprints, so one warm process serves every
+session (and every API request) from the same objects without pickling
+copies. Callers must treat returned frames as read-only.
+"""
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from . import telemetry
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def versioned(max_entries=4):
+    """LRU-memoizes a function on its arguments, skipping any named with a leading underscore.
+
+    Like st.cache_data, `_data`-style parameters are excluded from the key, so
+    pass the data version alongside the frames it was built from.
+    """
+    def decorator(fn):
+        entries = OrderedDict()
+        lock = threading.Lock()
+        names = fn.__code__.co_varnames[:fn.__code__.co_argcount]
+        label = f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+
+        def key_of(args, kwargs):
+            bound = dict(zip(names, args), **kwargs)
+            return _freeze({k: v for k, v in bound.items() if not k.startswith("_")})
+
+        def peek(*args, **kwargs):
+            """(True, value) if these arguments are cached, else (False, None); never computes."""
+            key = key_of(args, kwargs)
+            with lock:
+                return (True, entries[key]) if key in entries else (False, None)
+
+        def prime(value, *args, **kwargs):
+            """Stores value as the result for these arguments (e.g. computed in another process)."""
+            with lock:
+                entries[key_of(args, kwargs)] = value
+                while len(entries) > max_entries:
+                    entries.popitem(last=False)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = key_of(args, kwargs)
+            with lock:
+                if key in entries:
+                    entries.move_to_end(key)
+                    telemetry.count(f"cache.hit.{label}")
+                    return entries[key]
+            telemetry.count(f"cache.miss.{label}")
+            with telemetry.span(label):
+                result = fn(*args, **kwargs)
+            with lock:
+                entries[key] = result
+                while len(entries) > max_entries:
+                    entries.popitem(last=False)
+            return result
+
+        wrapper.cache_clear = entries.clear
+        wrapper.peek = peek
+        wrapper.prime = prime
+        return wrapper
+    return decorator
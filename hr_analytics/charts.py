@@ -0,0 +1,141 @@
+"""Plotly figure builders for the dashboard pages.
+
+Kept out of the package namespace: importing hr_analytics does not import
+plotly, only importing this module does. Every builder takes precomputed
+aggregate frames and does no pandas work of its own.
+"""
+import plotly.express as px
+
+from .telemetry import timed
+from .theme import DANGER, PERFORMANCE_COLORS, PRIMARY, SECONDARY, TEXT_COLOR
+
+WHITE_LAYOUT = dict(plot_bgcolor="white", paper_bgcolor="white", font=dict(color=TEXT_COLOR))
+
+
+@timed("chart")
+def bu_headcount(bu_counts):
+    fig = px.bar(bu_counts, x='Business Unit', y='Count', color='Business Unit', text='Count',
+                 color_discrete_sequence=px.colors.qualitative.Prism)
+    fig.update_layout(**WHITE_LAYOUT, showlegend=False)
+    return fig
+
+
+@timed("chart")
+def performance_pulse(perf_counts):
+    fig = px.pie(perf_counts, names='Category', values='Count', hole=0.6,
+                 color='Category', color_discrete_map=PERFORMANCE_COLORS)
+    fig.update_layout(**WHITE_LAYOUT, margin=dict(t=0, b=0, l=0, r=0), showlegend=False)
+    return fig
+
+
+@timed("chart")
+def hiring_funnel(funnel):
+    fig = px.funnel(funnel, x='Count', y='Stage', color='Stage', color_discrete_sequence=px.colors.qualitative.Safe)
+    fig.update_layout(**WHITE_LAYOUT)
+    return fig
+
+
+@timed("chart")
+def name_bars(window, color):
+    """One horizontal bar per person in window (already sliced to the visible page)."""
+    fig = px.bar(window, x='count', y='Name', orientation='h',
+                 text='Name', color_discrete_sequence=[color])
+    fig.update_layout(
+        **WHITE_LAYOUT,
+        yaxis={'visible': True, 'showticklabels': False, 'title': '', 'autorange': 'reversed'},
+        xaxis={'visible': False},
+        showlegend=False,
+        height=max(300, len(window) * 40),
+        margin=dict(l=0, r=0, t=0, b=0)
+    )
+    fig.update_traces(textposition='inside', insidetextanchor='start')
+    return fig
+
+
+@timed("chart")
+def exit_trend(trend_df):
+    fig = px.area(trend_df, x='ExitMonth', y='Exits', title="Monthly Exits", markers=True)
+    fig.update_traces(line_color=DANGER, fillcolor="rgba(231, 76, 60, 0.2)")
+    fig.update_layout(**WHITE_LAYOUT)
+    return fig
+
+
+@timed("chart")
+def headcount_trend(series):
+    """Headcount line over joiner/exit bars for a timeseries.series() frame."""
+    df = series.reset_index()
+    fig = px.bar(df, x='Period', y=['Joiners', 'Exits'], barmode='group',
+                 color_discrete_map={'Joiners': SECONDARY, 'Exits': DANGER})
+    fig.add_scatter(x=df['Period'], y=df['Headcount'], name='Headcount', mode='lines',
+                    line=dict(color=PRIMARY, width=3), yaxis='y2')
+    fig.update_layout(**WHITE_LAYOUT, yaxis=dict(title='Joiners / Exits'),
+                      yaxis2=dict(title='Headcount', overlaying='y', side='right', rangemode='tozero'),
+                      legend=dict(orientation='h', title=''), xaxis_title='')
+    return fig
+
+
+@timed("chart")
+def attrition_trend(series):
+    fig = px.line(series.reset_index(), x='Period', y='Attrition %', title="Rolling 12-Month Attrition")
+    fig.update_traces(line_color=DANGER)
+    fig.update_layout(**WHITE_LAYOUT, xaxis_title='')
+    return fig
+
+
+@timed("chart")
+def tenure_bands(bands):
+    fig = px.bar(bands, x='Tenure', y='Count', text='Count', color_discrete_sequence=[PRIMARY])
+    fig.update_layout(**WHITE_LAYOUT, xaxis_title='')
+    return fig
+
+
+@timed("chart")
+def attendance_trend(org):
+    """Average hours per worked day (bars) and WFH share (line) for an attendance.org_rollup() frame."""
+    fig = px.bar(org, x='Period', y='Avg Hours/Day', color_discrete_sequence=[PRIMARY])
+    fig.add_scatter(x=org['Period'], y=org['WFH Share %'], name='WFH Share %', mode='lines+markers',
+                    line=dict(color=SECONDARY, width=3), yaxis='y2')
+    fig.update_layout(**WHITE_LAYOUT, yaxis2=dict(title='WFH Share %', overlaying='y', side='right', rangemode='tozero'),
+                      legend=dict(orientation='h', title=''), xaxis_title='')
+    return fig
+
+
+@timed("chart")
+def employee_hours(daily):
+    """One bar per day for a single employee, coloured by attendance status."""
+    fig = px.bar(daily, x='Date', y='Hours', color='Status', hover_data=['Code'],
+                 color_discrete_map={'Worked': PRIMARY, 'WFH': SECONDARY, 'Present': PRIMARY, 'Leave': DANGER})
+    fig.update_layout(**WHITE_LAYOUT, xaxis_title='', legend=dict(orientation='h', title=''))
+    return fig
+
+
+@timed("chart")
+def leave_trend(trend):
+    """Days taken per month, one line per leave type, for the leave section's trend frame."""
+    fig = px.line(trend, x='Month', y='Days', color='Leave Type', markers=True)
+    fig.update_layout(**WHITE_LAYOUT, xaxis_title='', legend=dict(orientation='h', title=''))
+    return fig
+
+
+@timed("chart")
+def leave_years(years):
+    """Availed days per leave type, one bar per Leave Record period."""
+    fig = px.bar(years, x='Leave Type', y='Availed', color='Period', barmode='group',
+                 color_discrete_sequence=[SECONDARY, PRIMARY, DANGER])
+    fig.update_layout(**WHITE_LAYOUT, xaxis_title='', legend=dict(orientation='h'))
+    return fig
+
+
+@timed("chart")
+def org_sunburst(org_tree, path):
+    fig = px.sunburst(org_tree, path=path, values='Count', color='Business Unit', height=600)
+    fig.update_layout(**WHITE_LAYOUT)
+    return fig
+
+
+@timed("chart")
+def performance_distribution(perf_counts):
+    fig = px.bar(perf_counts, x='Category', y='Count', color='Category',
+                 color_discrete_map=PERFORMANCE_COLORS)
+    fig.update_layout(**WHITE_LAYOUT)
+    return fig
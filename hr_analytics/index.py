@@ -0,0 +1,60 @@
+"""Employee index: row-position lookups built once per data version.
+
+Drill-downs slice with iloc through these instead of scanning a column with
+a boolean mask. Each dataset is indexed separately, so a page that loads
+only some datasets only indexes those.
+"""
+from .cache import versioned
+
+INDEXED_COLUMNS = {
+    "active": ['Business Unit', 'Department', 'Designation', 'Employment Status'],
+    "inactive": ['Business Unit', 'Employment Status'],
+    "recruitment": ['Funnel Stage', 'BU', 'Status'],
+    "performance": ['Category'],
+    "attendance": ['Employee Name'],
+    "leave": ['Employee Name', 'Leave Type', 'Period'],
+    "leave_monthly": ['Employee Name'],
+}
+# unique-key lookups (first row wins), read by the Movement detail panes
+KEY_COLUMNS = {
+    "active": ['Name'],
+    "inactive": ['Name'],
+}
+
+
+@versioned(max_entries=2 * len(set(INDEXED_COLUMNS) | set(KEY_COLUMNS)))
+def index_dataset(name, shards, _df):
+    """({column: {value: positions}}, {column: {key: position}}) for one dataset version."""
+    groups = {c: _df.groupby(c, observed=True, sort=False).indices for c in INDEXED_COLUMNS.get(name, ()) if c in _df.columns}
+    keys = {}
+    for c in KEY_COLUMNS.get(name, ()):
+        if c not in _df.columns: continue
+        k = _df[c].dropna().astype(str)
+        # first occurrence wins for duplicated keys
+        keys[c] = dict(zip(k.to_numpy()[::-1], _df.index.get_indexer(k.index)[::-1]))
+    return groups, keys
+
+
+def build_index(versions, data):
+    """{"groups": {dataset: {column: {value: positions}}}, "keys": {dataset: {column: {key: position}}}}.
+
+    Covers the indexed datasets present in data, each built once per version.
+    """
+    groups, keys = {}, {}
+    for name in data:
+        if name in INDEXED_COLUMNS or name in KEY_COLUMNS:
+            groups[name], keys[name] = index_dataset(name, versions.get(name, ()), data[name])
+    return {"groups": groups, "keys": keys}
+
+
+def drill(data, index, dataset, column, value):
+    """Rows of data[dataset] where column == value, via the group index."""
+    df = data[dataset]
+    positions = index["groups"].get(dataset, {}).get(column, {}).get(value)
+    return df.iloc[positions] if positions is not None else df.iloc[0:0]
+
+
+def lookup(data, index, dataset, column, key):
+    """Row of data[dataset] whose column equals key, or None."""
+    pos = index["keys"].get(dataset, {}).get(column, {}).get(str(key))
+    return data[dataset].iloc[pos] if pos is not None else None
@@ -0,0 +1,177 @@
+"""Sharded ingestion across offices and periods.
+
+Every dataset can come from many workbooks (one per office, year or review
+cycle). The shards are listed in hr_manifest.json when present, otherwise
+discovered by matching the file names the HR team already uses, e.g.
+"Employee Master Sheet - Karachi Office.xlsx" or "Leave Record - 2026.xlsx".
+Shards with an Arrow snapshot are mapped in process; workbooks that need a
+real parse are parsed in parallel worker processes, one per workbook
+(openpyxl is CPU-bound, so threads don't help), and each dataset is the
+concatenation of its shards with Office and Period columns. When a refresher
+publishes datasets to HR_SHARED_DIR (see shared), those are mapped instead.
+
+hr_manifest.json maps a source to its files, for example:
+
+    {"master": [{"path": "hq/master.xlsx", "office": "Dubai"}],
+     "leave": [{"path": "Leave Record - 2025.xlsx", "period": "2025"}]}
+"""
+import json
+import os
+import pickle
+import re
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from . import shared, snapshot, telemetry
+from .cache import versioned
+from .loaders import LOADERS, is_snapshotted, with_categories
+from .snapshot import file_fingerprint
+
+DATA_DIR = os.environ.get("HR_DATA_DIR", ".")
+MANIFEST_FILE = "hr_manifest.json"
+INGEST_WORKERS = int(os.environ.get("HR_INGEST_WORKERS", "0")) or os.cpu_count() or 1
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # on the workers' PYTHONPATH
+
+# source -> (file name pattern, datasets parsed from each matching workbook)
+SOURCES = {
+    "master": (r"Employee Master Sheet - (?P<office>.+)\.xlsx$", ["active", "inactive"]),
+    "recruitment": (r"Hirings Requests (?P<office>.+)\.xlsx$", ["recruitment"]),
+    "performance": (r"Increment - (?P<office>.+?) _ (?P<period>.+)\.xlsx$", ["performance"]),
+    "leave": (r"Leave Record - (?P<period>.+)\.xlsx$", ["leave", "leave_monthly"]),
+    "attendance": (r"Staff Working Hours - (?P<period>.+)\.xlsx$", ["attendance"]),
+    "interviews": (r"Interview Evaluation Form(?: - (?P<office>.+))?\.xlsx$", ["interviews"]),
+}
+DATASETS = [name for _, names in SOURCES.values() for name in names]
+
+MONTHS = {m: i for i, m in enumerate(["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1)}
+
+
+def period_key(period):
+    """Sortable (year, month) for labels like "2025" or "Apr - Sep 25"; the last month/year mentioned wins."""
+    text = str(period or "").lower()
+    years = re.findall(r"\b(\d{4}|\d{2})\b", text)
+    months = [MONTHS[m] for m in re.findall(r"\b(" + "|".join(MONTHS) + r")[a-z]*\b", text)]
+    year = int(years[-1]) if years else 0
+    if 0 < year < 100: year += 2000
+    return (year, months[-1] if months else 12)
+
+
+def discover(data_dir=None):
+    """{source: [(path, office, period), ...]} from the manifest, else from file names."""
+    data_dir = data_dir or DATA_DIR
+    manifest_path = os.path.join(data_dir, MANIFEST_FILE)
+    found = {source: [] for source in SOURCES}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f: manifest = json.load(f)
+        for source, entries in manifest.items():
+            if source not in SOURCES: continue
+            for e in entries:
+                found[source].append((os.path.join(data_dir, e["path"]), e.get("office", ""), str(e.get("period", ""))))
+    else:
+        for fname in sorted(os.listdir(data_dir)):
+            if fname.startswith("~$"): continue  # Excel lock files
+            for source, (pattern, _) in SOURCES.items():
+                m = re.match(pattern, fname)
+                if m:
+                    groups = m.groupdict()
+                    found[source].append((os.path.join(data_dir, fname), groups.get("office") or "", groups.get("period") or ""))
+                    break
+    for shards in found.values():
+        shards.sort(key=lambda s: (s[1], period_key(s[2])))
+    return found
+
+
+def data_versions(data_dir=None):
+    """{dataset: ((path, office, period, fingerprint), ...)} for every shard that exists.
+
+    Cheap enough to call on every rerun or request; it lists and stats the
+    files, so it doubles as the change poll that decides which shards miss.
+    """
+    versions = {}
+    for source, shards in discover(data_dir).items():
+        stamped = tuple((path, office, period, fp) for path, office, period in shards
+                        for fp in [file_fingerprint(path)] if fp is not None)
+        for name in SOURCES[source][1]:
+            versions[name] = stamped
+    return versions
+
+
+def _run_worker(path, shards):
+    """{name: frame or None} for one workbook parsed by a fresh interpreter (see _ingest_worker).
+
+    A worker that fails leaves its shards to be parsed here.
+    """
+    task = pickle.dumps((path, shards, snapshot.SNAPSHOT_DIR))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [PACKAGE_ROOT, os.environ.get("PYTHONPATH")])))
+    done = subprocess.run([sys.executable, "-m", "hr_analytics._ingest_worker"], input=task, capture_output=True, env=env)
+    if done.returncode != 0:
+        telemetry.count("ingest.worker_failures")
+        return {name: LOADERS[name](path, fp) for name, fp in shards}
+    return pickle.loads(done.stdout)
+
+
+def _parse_missing(versions):
+    """Loads every shard not already in its loader's memo.
+
+    Snapshot hits are mapped in this process; workbooks that need a real
+    parse go to worker processes, one per workbook, when there are several.
+    """
+    parse = {}
+    for name, shards in versions.items():
+        for path, _, _, fp in shards:
+            if LOADERS[name].peek(path, fp)[0]: continue
+            if is_snapshotted(name, fp): LOADERS[name](path, fp)
+            else: parse.setdefault(path, []).append((name, fp))
+    workers = min(INGEST_WORKERS, len(parse))
+    if workers < 2:
+        for path, shards in parse.items():
+            for name, fp in shards: LOADERS[name](path, fp)
+        return
+    # the threads only wait on the worker processes; the parsing happens there
+    telemetry.count("ingest.worker_parses", len(parse))
+    with telemetry.span("ingest.parallel_parse"), ThreadPoolExecutor(max_workers=workers) as pool:
+        for (path, shards), frames in zip(parse.items(), pool.map(_run_worker, parse, parse.values())):
+            for name, fp in shards:
+                if frames[name] is None: LOADERS[name](path, fp)
+                else: LOADERS[name].prime(frames[name], path, fp)
+
+
+@versioned(max_entries=4 * len(DATASETS))
+def combine(name, shards, _frames):
+    """Concatenates one dataset's shard frames, tagged with Office and Period."""
+    parts = [df.assign(Office=office, Period=period) for (_, office, period, _), df in zip(shards, _frames) if not df.empty]
+    if not parts: return pd.DataFrame()
+    return with_categories(pd.concat(parts, ignore_index=True))
+
+
+def load_data(versions=None, datasets=DATASETS):
+    """The given datasets as {name: DataFrame}; datasets without readable shards are empty frames."""
+    versions = versions or data_versions()
+    data, pending = {}, {}
+    for name in datasets:
+        shards = versions.get(name, ())
+        hit, df = combine.peek(name, shards)
+        if hit:
+            data[name] = df
+            telemetry.count("cache.hit.ingest.combine")
+            continue
+        df = shared.read(name, shards)
+        if df is not None:
+            combine.prime(df, name, shards)
+            data[name] = df
+        else:
+            pending[name] = shards
+    _parse_missing(pending)
+    for name, shards in pending.items():
+        data[name] = combine(name, shards, [LOADERS[name](path, fp) for path, _, _, fp in shards])
+    return data
+
+
+def latest_period(df):
+    """Rows of df from its most recent Period (all rows when it has a single period)."""
+    if 'Period' not in df.columns or df['Period'].nunique() < 2: return df
+    latest = max(df['Period'].unique(), key=period_key)
+    return df[df['Period'] == latest]
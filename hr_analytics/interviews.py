@@ -0,0 +1,105 @@
+"""Interview evaluation forms, and their scores joined to the hiring funnel.
+
+"Interview Evaluation Form" workbooks hold filled copies of the panel's form
+(code FAMS-HR-IEF in A1), one candidate per sheet. Fields are read by their
+printed labels ("Candidate Name:", "Total:", ...) rather than by cell
+address, so a reflowed copy of the form still parses. Blank forms and the
+other HR forms in the workbook yield no rows.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+FORM_CODE = "FAMS-HR-IEF"
+# normalized label -> column; the first occurrence on a form wins
+FIELDS = {
+    "position": "Position",
+    "project/dept": "Project/Dept",
+    "candidate name": "Candidate Name",
+    "last employer": "Last Employer",
+    "obtained marks": "Written Test Marks",
+    "total": "Interview Score",
+    "gt": "Grand Total",
+}
+RECOMMENDATIONS = {"hire": "Hire", "hold": "Hold", "don't hire": "Don't Hire"}
+COLUMNS = list(FIELDS.values()) + ["Recommendation", "Form"]
+
+
+def _label(value):
+    return re.sub(r"\s+", " ", value).strip().rstrip(":").strip().lower() if isinstance(value, str) else None
+
+
+def position_key(values):
+    """Lower-cased, space-collapsed position titles, for joining forms to requisitions."""
+    return pd.Series(values, dtype=object).astype(str).str.lower().str.replace(r"\s+", " ", regex=True).str.strip()
+
+
+def _read_form(rows):
+    """{column: value} for one filled form, or None when the candidate name is blank."""
+    known = set(FIELDS) | set(RECOMMENDATIONS)
+    record = {}
+    for row in rows:
+        cells = [v for v in row if v is not None]
+        for i, v in enumerate(cells):
+            label = _label(v)
+            if label not in known: continue
+            after = cells[i + 1] if i + 1 < len(cells) else None
+            if after is None or _label(after) in known or (isinstance(after, str) and after.strip().endswith(":")): continue
+            if label in RECOMMENDATIONS:
+                record.setdefault("Recommendation", RECOMMENDATIONS[label])
+            else:
+                record.setdefault(FIELDS[label], after)
+    if not isinstance(record.get("Candidate Name"), str) or not record["Candidate Name"].strip(): return None
+    return record
+
+
+def read_forms(path):
+    """One row per filled interview form in the workbook (possibly none)."""
+    wb = load_workbook(path, read_only=True, data_only=True)
+    records = []
+    try:
+        for ws in wb.worksheets:
+            ws.reset_dimensions()
+            rows = ws.iter_rows(values_only=True)
+            first = next(rows, ())
+            if not any(isinstance(v, str) and v.startswith(FORM_CODE) for v in first): continue
+            record = _read_form(rows)
+            if record: records.append({**record, "Form": ws.title})
+    finally:
+        wb.close()
+    df = pd.DataFrame.from_records(records, columns=COLUMNS)
+    for col in ("Written Test Marks", "Interview Score", "Grand Total"):
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+
+def funnel_scores(recruitment, interviews):
+    """(per-stage interview summary, recruitment rows with their position's interview stats)."""
+    stats = pd.DataFrame(columns=["Interviewed", "Avg Interview Score", "Recommended Hire"])
+    if not interviews.empty and "Position" in interviews.columns:
+        g = interviews.groupby(position_key(interviews["Position"]).to_numpy())
+        stats = pd.DataFrame({
+            "Interviewed": g.size(),
+            "Avg Interview Score": g["Interview Score"].mean().round(1),
+            "Recommended Hire": g["Recommendation"].agg(lambda s: int((s == "Hire").sum())),
+        })
+    if recruitment.empty or "Position" not in recruitment.columns or "Funnel Stage" not in recruitment.columns:
+        return pd.DataFrame(columns=["Stage", "Requisitions"] + list(stats.columns)), recruitment
+
+    keys = position_key(recruitment["Position"]).to_numpy()
+    joined = recruitment.assign(**{c: stats[c].reindex(keys).to_numpy() for c in stats.columns})
+    # each position's candidates count once per stage, however many requisitions share the title
+    per_stage = joined.assign(_key=keys).drop_duplicates(["Funnel Stage", "_key"])
+    interviewed = per_stage["Interviewed"].fillna(0).astype(float)
+    weighted = (per_stage["Avg Interview Score"].astype(float) * interviewed).fillna(0)
+    g_stage = per_stage.groupby("Funnel Stage", observed=True, sort=False)
+    summary = pd.DataFrame({
+        "Requisitions": joined.groupby("Funnel Stage", observed=True, sort=False).size(),
+        "Interviewed": interviewed.groupby(per_stage["Funnel Stage"], observed=True, sort=False).sum().astype(int),
+        "Avg Interview Score": (weighted.groupby(per_stage["Funnel Stage"], observed=True, sort=False).sum()
+                                / interviewed.groupby(per_stage["Funnel Stage"], observed=True, sort=False).sum().replace(0, np.nan)).round(1),
+        "Recommended Hire": g_stage["Recommended Hire"].sum().astype(int),
+    }).rename_axis("Stage").reset_index()
+    return summary, joined
@@ -0,0 +1,129 @@
+"""Leave ledger: the wide leave Summary sheet normalized into long, typed frames.
+
+A "Leave Record" Summary sheet has a two-row header: the first row names a
+block (Qouta, Availed, Remaining, then one block per month) over its first
+column, the second row names the leave type of every column (CL, SL, ...,
+plus attendance counts such as Present and NLT). Columns are classified by
+the block they fall under, never by pandas' ".1"/".2" suffixes, so a sheet
+that adds or reorders a type still lands in the right place.
+
+read_summary() yields two frames per workbook, typed and categorical:
+the ledger (one row per employee and type: Entitled, Availed, Balance) and
+the monthly days per employee, type and month. The workbook's Period comes
+from its file name (see ingest), so several years concatenate cleanly.
+"""
+from itertools import zip_longest
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from .cache import versioned
+
+SHEET = "Summary"
+# first-header-row label (lower-cased) -> ledger measure
+MEASURES = {"qouta": "Entitled", "quota": "Entitled", "entitled": "Entitled",
+            "availed": "Availed", "remaining": "Balance", "balance": "Balance"}
+MONTH_NAMES = ["january", "february", "march", "april", "may", "june", "july",
+               "august", "september", "october", "november", "december"]
+# leave types; everything else on the sheet (Present, NLT, WFH) counts attendance
+LEAVE_TYPES = ["CL", "SL", "AL", "ML", "PL", "UL/HL", "COMP-L", "LWP"]
+ATTENDANCE_TYPES = ["Present", "NLT", "WFH"]
+TYPES = LEAVE_TYPES + ATTENDANCE_TYPES
+LEDGER_COLUMNS = ["Employee Name", "Designation", "Leave Type", "Entitled", "Availed", "Balance"]
+MONTHLY_COLUMNS = ["Employee Name", "Leave Type", "Month", "Days"]
+
+
+def _month(label):
+    text = str(label).strip().lower()
+    for i, name in enumerate(MONTH_NAMES, 1):
+        if text.startswith(name[:3]): return i
+    return None
+
+
+def column_map(blocks, types):
+    """[(column, block, leave type)] for every typed column; block is a MEASURES value or a month number."""
+    out, block = [], None
+    # the block row ends at the last block's label; its other types are still read
+    for i, (b, t) in enumerate(zip_longest(blocks, types)):
+        if b is not None and str(b).strip():
+            label = str(b).strip().lower()
+            block = MEASURES.get(label) or _month(label)
+        if block is not None and isinstance(t, str) and t.strip():
+            out.append((i, block, t.strip()))
+    return out
+
+
+def _frames(header_blocks, header_types, rows):
+    """(ledger, monthly) frames for the data rows under a two-row header."""
+    names_col = next(i for i, v in enumerate(header_blocks) if isinstance(v, str) and v.strip() == "Employee Name")
+    desig_col = next((i for i, v in enumerate(header_blocks) if isinstance(v, str) and v.strip() == "Designation"), None)
+    columns = column_map(header_blocks, header_types)
+    width = max((c for c, _, _ in columns), default=names_col) + 1
+
+    kept = [r for r in rows if len(r) > names_col and isinstance(r[names_col], str) and r[names_col].strip()]
+    grid = np.full((len(kept), width), None, dtype=object)
+    for i, r in enumerate(kept):
+        r = r[:width]
+        grid[i, :len(r)] = r
+    names = np.array([r[names_col].strip() for r in kept], dtype=object)
+    desig = grid[:, desig_col] if desig_col is not None else np.full(len(kept), None, dtype=object)
+    values = pd.to_numeric(pd.Series(grid.ravel()), errors="coerce").to_numpy(dtype="float64").reshape(grid.shape)
+
+    # ledger: one row per (employee, type) that has any of the three measures
+    types = list(dict.fromkeys(t for _, block, t in columns if isinstance(block, str)))
+    measures = {m: np.full((len(kept), len(types)), np.nan) for m in ("Entitled", "Availed", "Balance")}
+    for c, block, t in columns:
+        if isinstance(block, str): measures[block][:, types.index(t)] = values[:, c]
+    has_any = ~np.all([np.isnan(m) for m in measures.values()], axis=0)
+    row, col = np.nonzero(has_any)
+    categories = TYPES + [t for t in types if t not in TYPES]
+    ledger = pd.DataFrame({
+        "Employee Name": pd.Categorical(names[row]),
+        "Designation": pd.Categorical(desig[row].astype(object)),
+        "Leave Type": pd.Categorical(np.array(types, dtype=object)[col], categories=categories),
+        **{m: arr[row, col].astype("float32") for m, arr in measures.items()},
+    })
+
+    # monthly: days per (employee, type, month), zero and blank cells dropped
+    month_cols = [(c, block, t) for c, block, t in columns if not isinstance(block, str)]
+    days = values[:, [c for c, _, _ in month_cols]] if month_cols else np.empty((len(kept), 0))
+    row, k = np.nonzero(np.nan_to_num(days) != 0)
+    month_types = [t for _, _, t in month_cols]
+    monthly = pd.DataFrame({
+        "Employee Name": pd.Categorical(names[row]),
+        "Leave Type": pd.Categorical(np.array(month_types, dtype=object)[k],
+                                     categories=categories + [t for t in dict.fromkeys(month_types) if t not in categories]),
+        "Month": np.array([b for _, b, _ in month_cols], dtype="int8")[k],
+        "Days": days[row, k].astype("float32"),
+    })
+    return ledger, monthly
+
+
+@versioned(max_entries=2)
+def read_summary(path, fingerprint):
+    """(ledger, monthly) for a leave workbook's Summary sheet; both loaders share one parse per version."""
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[SHEET]
+        ws.reset_dimensions()
+        rows = ws.iter_rows(values_only=True)
+        blocks, types = next(rows, ()), next(rows, ())
+        if "Employee Name" not in blocks:
+            return pd.DataFrame(columns=LEDGER_COLUMNS), pd.DataFrame(columns=MONTHLY_COLUMNS)
+        return _frames(list(blocks), list(types), rows)
+    finally:
+        wb.close()
+
+
+def month_start(monthly):
+    """Month Start dates for a monthly frame, taking the year from each row's Period."""
+    from .ingest import period_key
+
+    if "Period" in monthly.columns:
+        year_of = {p: period_key(p)[0] for p in pd.unique(monthly["Period"])}
+        years = monthly["Period"].map(year_of)
+    else:
+        years = 0
+    return pd.to_datetime(pd.DataFrame({"year": np.asarray(years, dtype="int64"), "month": monthly["Month"].astype("int64"), "day": 1}),
+                          errors="coerce")
@@ -0,0 +1,165 @@
+"""Workbook loaders: one per dataset, memoized on the source file fingerprint."""
+import numpy as np
+import pandas as pd
+
+from .attendance import read_hours
+from .cache import versioned
+from .interviews import read_forms
+from .leave import read_summary
+from .snapshot import has_snapshot, read_sheet, sheet_options, snapshotted
+
+# Row classifiers are driven by these tables and evaluated column-wise, so new
+# funnel stages or score bands are a table edit, not a new per-row function.
+# Funnel rules are checked in order against the lower-cased 'Standing' text;
+# the first matching regex wins.
+FUNNEL_STAGE_RULES = [
+    ("Hired", r"join|hired"),
+    ("Offer Extended", r"offer"),
+    ("Interview", r"interview"),
+    ("Shortlisted", r"shortlist"),
+]
+FUNNEL_DEFAULT_STAGE = "Applied"
+
+# Score bands as (lower bound inclusive, label), ascending. Missing scores
+# get PERFORMANCE_DEFAULT_BAND.
+PERFORMANCE_BANDS = [
+    (float("-inf"), "Low Performer"),
+    (70, "Average"),
+    (85, "High Performer"),
+]
+PERFORMANCE_DEFAULT_BAND = "Average"
+
+
+def classify_stage(standing):
+    s = standing.astype(str).str.lower()
+    conditions = [s.str.contains(pattern, regex=True).to_numpy() for _, pattern in FUNNEL_STAGE_RULES]
+    labels = [label for label, _ in FUNNEL_STAGE_RULES]
+    return pd.Series(np.select(conditions, labels, default=FUNNEL_DEFAULT_STAGE), index=standing.index)
+
+
+def classify_score(scores):
+    bounds = [b for b, _ in PERFORMANCE_BANDS] + [float("inf")]
+    bands = pd.cut(scores, bins=bounds, labels=[label for _, label in PERFORMANCE_BANDS], right=False)
+    return bands.astype(object).where(bands.notna(), PERFORMANCE_DEFAULT_BAND)
+
+
+# --- PER-DATASET LOADERS ---
+# Each loader parses one workbook and is memoized on that file's fingerprint,
+# so saving one workbook only re-parses that workbook on the next poll.
+# Which workbooks exist is decided by hr_analytics.ingest; the memo is sized
+# so every office/period shard stays resident.
+SHARD_CACHE_ENTRIES = 128
+
+# Active Staff is streamed and trimmed to the columns the dashboard reads.
+ACTIVE_COLUMNS = [
+    'Employee Number', 'Name', 'Designation', 'Department', 'Business Unit',
+    'Reporting To', 'Employment Status', 'Joining Date', 'Email',
+]
+
+# Low-cardinality text columns are stored as categoricals: far smaller than
+# object strings, and group lookups on them are code comparisons.
+CATEGORY_COLUMNS = ['Business Unit', 'BU', 'Department', 'Designation', 'Employment Status', 'Status', 'Office']
+
+
+def with_categories(df):
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and pd.api.types.infer_dtype(df[col], skipna=True) == 'string':
+            df[col] = df[col].astype('category')
+    return df
+
+
+@versioned(max_entries=SHARD_CACHE_ENTRIES)
+def load_active(path, fingerprint):
+    try:
+        df_act = read_sheet(path, "Active Staff", header_keys=("Employee Number", "Name"), columns=ACTIVE_COLUMNS)
+        if df_act is None: return pd.DataFrame()
+        df_act = df_act[df_act['Name'].notna()]
+        df_act = df_act[df_act['Employee Number'] != 'Employee Number'].copy()
+        if 'Business Unit' in df_act.columns: df_act['Business Unit'] = df_act['Business Unit'].fillna('Unassigned')
+        if 'Reporting To' in df_act.columns: df_act['Reporting To'] = df_act['Reporting To'].fillna('Direct to CEO')
+        if 'Joining Date' in df_act.columns: df_act['Joining Date'] = pd.to_datetime(df_act['Joining Date'], errors='coerce')
+        return with_categories(df_act)
+    except: return pd.DataFrame()
+
+
+@versioned(max_entries=SHARD_CACHE_ENTRIES)
+def load_inactive(path, fingerprint):
+    try:
+        df_inact = read_sheet(path, "Inactive Staff", header=0)
+        if 'Exit Date' in df_inact.columns: df_inact['Exit Date'] = pd.to_datetime(df_inact['Exit Date'], errors='coerce')
+        return with_categories(df_inact)
+    except: return pd.DataFrame()
+
+
+@versioned(max_entries=SHARD_CACHE_ENTRIES)
+def load_recruitment(path, fingerprint):
+    try:
+        df_rec = read_sheet(path, "Progress")
+        if 'Standing' in df_rec.columns: df_rec['Funnel Stage'] = classify_stage(df_rec['Standing'])
+        return with_categories(df_rec)
+    except: return pd.DataFrame()
+
+
+@versioned(max_entries=SHARD_CACHE_ENTRIES)
+def load_performance(path, fingerprint):
+    try:
+        df_perf = read_sheet(path, "Evaluation Data")
+        if 'Total Points (Out of 100)' not in df_perf.columns: return pd.DataFrame()
+        df_perf['Total Points (Out of 100)'] = pd.to_numeric(df_perf['Total Points (Out of 100)'], errors='coerce')
+        df_perf['Category'] = classify_score(df_perf['Total Points (Out of 100)'])
+        return df_perf
+    except: return pd.DataFrame()
+
+
+# The leave Summary sheet is parsed once into both the ledger and the monthly
+# days (see hr_analytics.leave); each is snapshotted on its own.
+@versioned(max_entries=SHARD_CACHE_ENTRIES)
+def load_leave(path, fingerprint):
+    try:
+        return snapshotted(path, "leave ledger", (), lambda: read_summary(path, fingerprint)[0])
+    except: return pd.DataFrame()
+
+
+@versioned(max_entries=SHARD_CACHE_ENTRIES)
+def load_leave_monthly(path, fingerprint):
+    try:
+        return snapshotted(path, "leave monthly", (), lambda: read_summary(path, fingerprint)[1])
+    except: return pd.DataFrame()
+
+
+@versioned(max_entries=SHARD_CACHE_ENTRIES)
+def load_attendance(path, fingerprint):
+    try:
+        df_hours = snapshotted(path, "working hours", (), lambda: read_hours(path))
+        return df_hours if df_hours is not None else pd.DataFrame()
+    except: return pd.DataFrame()
+
+
+@versioned(max_entries=SHARD_CACHE_ENTRIES)
+def load_interviews(path, fingerprint):
+    try:
+        return snapshotted(path, "interview forms", (), lambda: read_forms(path))
+    except: return pd.DataFrame()
+
+LOADERS = {
+    "active": load_active, "inactive": load_inactive,
+    "recruitment": load_recruitment, "performance": load_performance,
+    "leave": load_leave, "leave_monthly": load_leave_monthly,
+    "attendance": load_attendance, "interviews": load_interviews,
+}
+
+# (sheet label, options) each loader above snapshots under; keep in step with
+# the loaders so ingest can tell a snapshot hit from a workbook parse.
+SNAPSHOT_KEYS = {
+    "active": ("Active Staff", sheet_options(header_keys=("Employee Number", "Name"), columns=ACTIVE_COLUMNS)),
+    "inactive": ("Inactive Staff", sheet_options()),
+    "recruitment": ("Progress", sheet_options()),
+    "performance": ("Evaluation Data", sheet_options()),
+    "leave": ("leave ledger", ()), "leave_monthly": ("leave monthly", ()),
+    "attendance": ("working hours", ()), "interviews": ("interview forms", ()),
+}
+
+
+def is_snapshotted(name, fingerprint):
+    """True when loading dataset name from this workbook version reads a snapshot rather than parsing."""
+    return has_snapshot(fingerprint, *SNAPSHOT_KEYS[name])
@@ -0,0 +1,244 @@
+"""Reporting-line graph built from the active roster's "Reporting To" column.
+
+"Reporting To" holds whatever HR typed: first names ("Shahzad"), partial or
+abbreviated names ("M. Sajid", "Usama Ejaz"), several people ("Fatima &
+Arslan") or a role ("CEO"). Each distinct value is resolved to an employee
+once per data version by name tokens (every token of the reference must
+appear in the employee's name, preferring the same office). Values that
+match nobody, or several people equally, become external manager nodes so
+their teams still show up.
+
+Nodes are laid out in depth-first order, so everyone under a manager is one
+contiguous slice of that order and a subtree query is a slice, not a walk.
+"""
+import re
+import threading
+from collections import OrderedDict, defaultdict
+
+import numpy as np
+import pandas as pd
+
+# spellings of the same token; the key is what the index stores
+ALIASES = {"m": "muhammad", "muhammed": "muhammad", "mohammad": "muhammad", "mohammed": "muhammad", "md": "muhammad"}
+# honorifics and very common given names, dropped when the full reference matches nobody
+COMMON_TOKENS = {"muhammad", "hafiz", "syed", "mian", "sheikh", "ch", "mr", "ms", "dr"}
+_SPLIT = re.compile(r"\s*(?:&|/|,|\band\b)\s*", re.IGNORECASE)
+TEAM_CACHE_ENTRIES = 64
+
+
+def name_tokens(name):
+    """Normalized name tokens ("M. Sajid" -> ("muhammad", "sajid"))."""
+    words = re.findall(r"[a-z0-9]+", str(name).lower())
+    return tuple(ALIASES.get(w, w) for w in words)
+
+
+def _candidates(tokens, by_token):
+    """Employees whose names contain every token (rarest token first, so the sets stay small)."""
+    sets = sorted((by_token.get(t, set()) for t in set(tokens)), key=len)
+    if not sets: return set()
+    found = set(sets[0])
+    for other in sets[1:]:
+        found &= other
+        if not found: break
+    return found
+
+
+def resolve(reference, by_token, first_tokens, offices=None, office=None, exclude=None):
+    """Employee position a single manager reference points to, or None (no match or ambiguous)."""
+    tokens = name_tokens(reference)
+    found = _candidates(tokens, by_token) - {exclude}
+    if not found:
+        found = _candidates(tuple(t for t in tokens if t not in COMMON_TOKENS), by_token) - {exclude}
+    if len(found) > 1 and offices is not None and office is not None:
+        found = {p for p in found if offices[p] == office} or found
+    if len(found) > 1:
+        # "Shahzad" means the Shahzad whose name starts with it over one who merely has it
+        leading = {p for p in found if first_tokens[p] == tokens[0]}
+        found = leading or found
+    return next(iter(found)) if len(found) == 1 else None
+
+
+class OrgGraph:
+    """Parent/child adjacency over employees (rows of the active frame) and external managers.
+
+    Node i < n_employees is row i of the roster; later nodes are external
+    managers. parent[i] is -1 for roots. order is the depth-first layout and
+    start[i]:start[i] + size[i] its slice holding i and everyone under i.
+    """
+
+    def __init__(self, names, reports_to, offices=None):
+        names = [str(v).strip() for v in names]
+        n = len(names)
+        tokens = [name_tokens(v) for v in names]
+        by_token = defaultdict(set)
+        for i, toks in enumerate(tokens):
+            for t in toks: by_token[t].add(i)
+        first_tokens = [toks[0] if toks else None for toks in tokens]
+        offices = None if offices is None else list(offices)
+
+        self.names = list(names)
+        self.external = {}  # normalized reference -> node
+        parent = np.full(n, -1, dtype=np.int64)
+        self.reference = [None] * n
+        self.also_reports_to = {}  # node -> [other manager nodes] for "A & B"
+        self.unresolved = defaultdict(int)  # reference -> employees pointing at it
+        resolved = {}  # (reference, office) -> position; most rows share a handful of managers
+
+        for i, ref in enumerate(reports_to):
+            if ref is None or (isinstance(ref, float) and np.isnan(ref)) or not str(ref).strip(): continue
+            ref = str(ref).strip()
+            self.reference[i] = ref
+            managers = []
+            for part in (p for p in _SPLIT.split(ref) if p):
+                office = offices[i] if offices else None
+                if (part, office) not in resolved:
+                    resolved[part, office] = resolve(part, by_token, first_tokens, offices, office)
+                pos = resolved[part, office]
+                if pos == i:  # "Shahzad" on Shahzad's own row means another Shahzad
+                    pos = resolve(part, by_token, first_tokens, offices, office, exclude=i)
+                if pos is None:
+                    self.unresolved[part] += 1
+                    key = " ".join(name_tokens(part)) or part.lower()
+                    if key not in self.external:
+                        self.external[key] = len(self.names)
+                        self.names.append(part)
+                    pos = self.external[key]
+                managers.append(pos)
+            parent[i] = managers[0]
+            if len(managers) > 1: self.also_reports_to[i] = managers[1:]
+
+        self.n_employees = n
+        self.parent = np.concatenate([parent, np.full(len(self.names) - n, -1, dtype=np.int64)])
+        self.cycles = self._break_cycles()
+        self._layout()
+        self._teams = OrderedDict()
+        self._teams_lock = threading.Lock()
+
+    def _break_cycles(self):
+        """Finds reporting loops (A -> B -> A) and cuts each at its first member, which becomes a root."""
+        state = np.zeros(len(self.parent), dtype=np.int8)  # 0 unseen, 1 on current path, 2 done
+        cycles = []
+        for start in range(len(self.parent)):
+            path, v = [], start
+            while v != -1 and state[v] == 0:
+                state[v] = 1
+                path.append(v)
+                v = self.parent[v]
+            if v != -1 and state[v] == 1:
+                loop = path[path.index(v):]
+                cycles.append([self.names[p] for p in loop])
+                self.parent[min(loop)] = -1
+            for p in path: state[p] = 2
+        return cycles
+
+    def _layout(self):
+        parent = self.parent
+        total = len(parent)
+        # children grouped by parent (CSR), each group in roster order
+        by_parent = np.argsort(parent, kind="stable")
+        child_start = np.searchsorted(parent[by_parent], np.arange(-1, total + 1))
+        def children(v):  # v == -1 gives the roots
+            return by_parent[child_start[v + 1]:child_start[v + 2]]
+
+        self.direct = np.diff(child_start)[1:total + 1]
+        order, depth = np.empty(total, dtype=np.int64), np.zeros(total, dtype=np.int64)
+        start, size = np.empty(total, dtype=np.int64), np.ones(total, dtype=np.int64)
+        stack, k = [(int(v), 0) for v in children(-1)[::-1]], 0
+        while stack:
+            v, d = stack.pop()
+            order[k], start[v], depth[v] = v, k, d
+            k += 1
+            stack.extend((int(c), d + 1) for c in children(v)[::-1])
+        # subtree sizes, deepest nodes first
+        for v in order[::-1]:
+            if parent[v] != -1: size[parent[v]] += size[v]
+        self.order, self.start, self.size, self.depth = order, start, size, depth
+        self.position = {}
+        for i, name in enumerate(self.names):
+            self.position.setdefault(name, i)
+
+    def __len__(self):
+        return len(self.names)
+
+    def node(self, name):
+        return self.position.get(name)
+
+    def subtree(self, node, include_self=False):
+        """Nodes under node (optionally with it), in depth-first order."""
+        s = self.start[node]
+        return self.order[s + (0 if include_self else 1):s + self.size[node]]
+
+    def reports(self, node):
+        """Direct reports of node."""
+        under = self.subtree(node)
+        return under[self.parent[under] == node]
+
+    def chain(self, node):
+        """node's managers from the top of its tree down to its direct manager."""
+        out = []
+        while self.parent[node] != -1:
+            node = self.parent[node]
+            out.append(node)
+        return out[::-1]
+
+    def employees(self, nodes):
+        """Roster row positions among nodes (drops external managers)."""
+        nodes = np.asarray(nodes, dtype=np.int64)
+        return nodes[nodes < self.n_employees]
+
+    def summary(self):
+        """One row per node: Name, Kind, Manager, Depth, Direct Reports, Team Size."""
+        parent = self.parent
+        return pd.DataFrame({
+            "Name": self.names,
+            "Kind": np.where(np.arange(len(self)) < self.n_employees, "Employee", "External"),
+            "Manager": [self.names[p] if p != -1 else None for p in parent],
+            "Depth": self.depth,
+            "Direct Reports": self.direct,
+            "Team Size": self.size - 1,
+        })
+
+    def managers(self):
+        """summary() rows of everyone with at least one report, largest team first."""
+        s = self.summary()
+        return s[s["Direct Reports"] > 0].sort_values(["Team Size", "Name"], ascending=[False, True], ignore_index=True)
+
+    def orphans(self):
+        """Employees without a manager on the roster, with the reason."""
+        rows = []
+        for i in range(self.n_employees):
+            p = self.parent[i]
+            if p != -1 and p < self.n_employees: continue
+            if self.reference[i] is None: reason = "No manager recorded"
+            elif p == -1: reason = "Reporting loop"
+            else: reason = "Manager not on roster"
+            rows.append({"Name": self.names[i], "Reporting To": self.reference[i], "Reason": reason})
+        return pd.DataFrame(rows, columns=["Name", "Reporting To", "Reason"])
+
+    def team(self, node, df):
+        """Rows of df (the roster this graph was built from) under node, with Level and Manager added.
+
+        Cached per node, so going back to a manager is a dictionary hit.
+        """
+        with self._teams_lock:
+            if node in self._teams:
+                self._teams.move_to_end(node)
+                return self._teams[node]
+        under = self.employees(self.subtree(node))
+        out = df.iloc[under].assign(**{
+            "Level": self.depth[under] - self.depth[node],
+            "Manager": [self.names[p] for p in self.parent[under]],
+        })
+        with self._teams_lock:
+            self._teams[node] = out
+            while len(self._teams) > TEAM_CACHE_ENTRIES:
+                self._teams.popitem(last=False)
+        return out
+
+
+def build_graph(df):
+    """OrgGraph for an active-roster frame (an empty graph without Name / Reporting To)."""
+    if df.empty or "Name" not in df.columns or "Reporting To" not in df.columns:
+        return OrgGraph([], [])
+    offices = df["Office"].astype(object).tolist() if "Office" in df.columns else None
+    return OrgGraph(df["Name"].tolist(), df["Reporting To"].astype(object).tolist(), offices)
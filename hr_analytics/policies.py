@@ -0,0 +1,196 @@
+"""Full-text search over the policy documents (.docx) beside the workbooks.
+
+Text is pulled straight out of each document's word/document.xml (no
+python-docx needed), split into passages of a few paragraphs, and term
+counts per passage are persisted to policy_index.json in the cache dir. A
+document is only re-read when its mtime or size changes; everything else
+comes from that file. The postings are kept in memory per set of document
+versions, so a query is a dictionary walk scored with BM25.
+"""
+import glob
+import json
+import math
+import os
+import re
+import zipfile
+from collections import Counter, defaultdict
+from xml.etree import ElementTree
+
+from . import telemetry
+from .cache import versioned
+from .snapshot import CACHE_DIR, file_fingerprint
+
+INDEX_FILE = "policy_index.json"
+INDEX_VERSION = 1
+PASSAGE_WORDS = 60  # paragraphs are merged until a passage has at least this many words
+SNIPPET_WORDS = 40
+K1, B = 1.5, 0.75
+STOPWORDS = set(
+    "a an and are as at be by for from has have in is it its of on or shall that the their this to was will with".split()
+)
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_TOKEN = re.compile(r"[A-Za-z0-9]+(?:['’][A-Za-z]+)?")
+
+
+def _term(word):
+    """Index term for one word: lower-cased, possessive and plural 's' dropped; None for stopwords."""
+    w = word.lower().replace("’", "'").split("'")[0]
+    if w in STOPWORDS: return None
+    if len(w) > 3 and w.endswith("s") and not w.endswith("ss"): w = w[:-1]
+    return w
+
+
+def terms(text):
+    return [t for t in (_term(m.group()) for m in _TOKEN.finditer(text)) if t]
+
+
+def read_paragraphs(path):
+    """Non-empty paragraph texts of a .docx, in document order (tables included)."""
+    with zipfile.ZipFile(path) as z:
+        root = ElementTree.fromstring(z.read("word/document.xml"))
+    paragraphs = []
+    for p in root.iter(f"{_W}p"):
+        parts = []
+        for node in p.iter():
+            if node.tag == f"{_W}t" and node.text: parts.append(node.text)
+            elif node.tag == f"{_W}tab": parts.append(" ")
+            elif node.tag in (f"{_W}br", f"{_W}cr"): parts.append(" ")
+        text = re.sub(r"\s+", " ", "".join(parts)).strip()
+        if text: paragraphs.append(text)
+    return paragraphs
+
+
+def passages(paragraphs):
+    """Consecutive paragraphs joined into passages of roughly PASSAGE_WORDS words."""
+    out, current, words = [], [], 0
+    for para in paragraphs:
+        current.append(para)
+        words += len(para.split())
+        if words >= PASSAGE_WORDS:
+            out.append("\n".join(current))
+            current, words = [], 0
+    if current: out.append("\n".join(current))
+    return out
+
+
+def _document_entry(path, fingerprint):
+    texts = passages(read_paragraphs(path))
+    return {
+        "fingerprint": list(fingerprint[1:]),
+        "title": os.path.splitext(os.path.basename(path))[0],
+        "passages": texts,
+        "tf": [dict(Counter(terms(t))) for t in texts],
+    }
+
+
+def document_versions(data_dir=None):
+    """((path, fingerprint), ...) for every .docx in the data folder; cheap enough for every rerun."""
+    from .ingest import DATA_DIR
+
+    paths = sorted(glob.glob(os.path.join(data_dir or DATA_DIR, "*.docx")))
+    return tuple((os.path.abspath(p), fp) for p in paths
+                 if not os.path.basename(p).startswith("~$") and (fp := file_fingerprint(p)))
+
+
+def _load_store(path):
+    try:
+        with open(path, encoding="utf-8") as f: store = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return store.get("docs", {}) if store.get("version") == INDEX_VERSION else {}
+
+
+def sync_store(versions, cache_dir=None):
+    """{path: entry} for versions, re-reading only new or changed documents and persisting the result."""
+    store_path = os.path.join(cache_dir or CACHE_DIR, INDEX_FILE)
+    stored = _load_store(store_path)
+    docs, changed = {}, set(stored) - {p for p, _ in versions}
+    for path, fingerprint in versions:
+        entry = stored.get(path)
+        if entry and entry["fingerprint"] == list(fingerprint[1:]):
+            docs[path] = entry
+            continue
+        try:
+            with telemetry.span("policies.read_docx"):
+                docs[path] = _document_entry(path, fingerprint)
+        except (OSError, KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+            continue  # unreadable or not a Word document
+        changed.add(path)
+    telemetry.count("policies.reindexed", len(changed))
+    if changed:
+        try:
+            os.makedirs(os.path.dirname(store_path) or ".", exist_ok=True)
+            with open(store_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "docs": docs}, f)
+            os.replace(store_path + ".tmp", store_path)
+        except OSError:
+            pass  # read-only deploys still search, they just re-read the documents on restart
+    return docs
+
+
+class PolicyIndex:
+    """BM25 postings over every passage of the indexed documents."""
+
+    def __init__(self, docs):
+        self.titles, self.texts, self.lengths = [], [], []
+        self.postings = defaultdict(list)  # term -> [(passage id, term count), ...]
+        for entry in docs.values():
+            for text, tf in zip(entry["passages"], entry["tf"]):
+                pid = len(self.texts)
+                self.titles.append(entry["title"])
+                self.texts.append(text)
+                self.lengths.append(sum(tf.values()))
+                for term, n in tf.items(): self.postings[term].append((pid, n))
+        self.documents = sorted(set(self.titles))
+        self.avg_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+
+    def __len__(self):
+        return len(self.texts)
+
+    def search(self, query, limit=10):
+        """[{"Document", "Score", "Passage", "Terms"}] best first, at most one hit per document unless few match."""
+        with telemetry.span("policies.search"):
+            query_terms = list(dict.fromkeys(terms(query)))
+            scores = defaultdict(float)
+            n = len(self.texts)
+            for term in query_terms:
+                postings = self.postings.get(term, ())
+                if not postings: continue
+                idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                for pid, tf in postings:
+                    norm = K1 * (1 - B + B * self.lengths[pid] / self.avg_length)
+                    scores[pid] += idf * tf * (K1 + 1) / (tf + norm)
+            ranked = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))
+            # best passage of each document first, then the runners-up
+            seen, first, rest = set(), [], []
+            for pid, score in ranked:
+                (rest if self.titles[pid] in seen else first).append((pid, score))
+                seen.add(self.titles[pid])
+            return [{"Document": self.titles[pid], "Score": round(score, 3), "Passage": self.texts[pid], "Terms": query_terms}
+                    for pid, score in (first + rest)[:limit]]
+
+
+@versioned(max_entries=2)
+def policy_index(versions, cache_dir=None):
+    """PolicyIndex for these document versions (see document_versions())."""
+    return PolicyIndex(sync_store(versions, cache_dir))
+
+
+def snippet(text, query_terms, words=SNIPPET_WORDS, mark=("**", "**"), escape=str):
+    """About `words` words of text around the densest run of query terms, with those terms wrapped in mark.
+
+    escape is applied to every word before marking (e.g. to escape Markdown).
+    """
+    tokens = text.split()
+    wanted = set(query_terms)
+    hits = [i for i, tok in enumerate(tokens) if any(_term(m.group()) in wanted for m in _TOKEN.finditer(tok))]
+    if hits:
+        # window start covering the most hits
+        start = max(range(len(hits)), key=lambda k: sum(1 for h in hits[k:] if h < hits[k] + words))
+        start = max(0, min(hits[start] - words // 4, len(tokens) - words))
+    else:
+        start = 0
+    hit_set = set(hits)
+    out = [f"{mark[0]}{escape(tok)}{mark[1]}" if i in hit_set else escape(tok) for i, tok in enumerate(tokens[start:start + words], start)]
+    return ("… " if start > 0 else "") + " ".join(out) + (" …" if start + words < len(tokens) else "")
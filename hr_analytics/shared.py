@@ -0,0 +1,116 @@
+"""Shared, read-only data tier for deployments with several dashboard processes.
+
+One refresher process (``python -m hr_analytics refresh --watch 30``) writes
+every combined dataset as an Arrow IPC file into HR_SHARED_DIR (ideally on
+tmpfs, e.g. /dev/shm/hr_dashboard) and publishes them through manifest.json.
+Workers memory-map those files instead of parsing workbooks, so the parse
+happens once per change for the whole deployment and the mapped pages live
+once in the OS page cache however many workers read them.
+
+A worker only takes a file whose recorded shard fingerprints match what it
+sees on disk; anything missing or stale falls back to the local ingest path.
+Leave HR_SHARED_DIR unset to disable the tier.
+"""
+import hashlib
+import json
+import os
+import time
+
+from . import telemetry
+from .snapshot import SNAPSHOT_VERSION, _read_snapshot, _write_snapshot
+
+SHARED_DIR = os.environ.get("HR_SHARED_DIR") or None
+MANIFEST = "manifest.json"
+
+_manifest_cache = {"key": None, "value": {}}
+
+
+def _plain(shards):
+    """shards as JSON would hand them back, for comparing against the manifest."""
+    return json.loads(json.dumps(shards))
+
+
+def _manifest(shared_dir):
+    path = os.path.join(shared_dir, MANIFEST)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return {}
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if _manifest_cache["key"] != key:
+        try:
+            with open(path, encoding="utf-8") as f: value = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        _manifest_cache.update(key=key, value=value)
+    return _manifest_cache["value"]
+
+
+def read(name, shards, shared_dir=None):
+    """The published frame for dataset name at exactly these shards, or None."""
+    shared_dir = shared_dir or SHARED_DIR
+    if not shared_dir: return None
+    entry = _manifest(shared_dir).get("datasets", {}).get(name)
+    if not entry or entry["shards"] != _plain(shards):
+        telemetry.count("shared.miss")
+        return None
+    try:
+        with telemetry.span("shared.read"):
+            df = _read_snapshot(os.path.join(shared_dir, entry["file"]))
+    except (OSError, ValueError):
+        telemetry.count("shared.miss")
+        return None  # pruned between the manifest read and the open; parse locally
+    telemetry.count("shared.hit")
+    return df
+
+
+def refresh(shared_dir=None, data_dir=None):
+    """Publishes every dataset whose shards changed; returns the names it wrote."""
+    from .ingest import data_versions, load_data
+
+    shared_dir = shared_dir or SHARED_DIR
+    if not shared_dir: raise ValueError("no shared directory: set HR_SHARED_DIR or pass one")
+    os.makedirs(shared_dir, exist_ok=True)
+    previous = _manifest(shared_dir).get("datasets", {})
+    versions = data_versions(data_dir)
+    data = load_data(versions)
+
+    published, written = {}, []
+    for name, df in data.items():
+        shards = _plain(versions.get(name, ()))
+        entry = previous.get(name)
+        if entry and entry["shards"] == shards and os.path.exists(os.path.join(shared_dir, entry["file"])):
+            published[name] = entry
+            continue
+        digest = hashlib.sha1(repr((SNAPSHOT_VERSION, shards)).encode()).hexdigest()[:16]
+        path = _write_snapshot(df, os.path.join(shared_dir, f"{name}-{digest}"))
+        published[name] = {"shards": shards, "file": os.path.basename(path)}
+        written.append(name)
+    if not written: return written
+
+    tmp = os.path.join(shared_dir, MANIFEST + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"published": time.time(), "datasets": published}, f)
+    os.replace(tmp, os.path.join(shared_dir, MANIFEST))
+
+    # keep the previous generation for workers still opening it; drop older files
+    keep = {e["file"] for e in published.values()} | {e["file"] for e in previous.values()} | {MANIFEST}
+    for fname in os.listdir(shared_dir):
+        if fname not in keep and not fname.endswith(".tmp"):
+            try: os.remove(os.path.join(shared_dir, fname))
+            except OSError: pass
+    return written
+
+
+def watch(interval=30, shared_dir=None, data_dir=None, log=print):
+    """Calls refresh() every interval seconds until interrupted."""
+    try:
+        while True:
+            try:
+                written = refresh(shared_dir, data_dir)
+                if written: log(f"published {', '.join(written)}")
+            except Exception as e:
+                log(f"refresh failed: {e}")  # keep serving the last good generation
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
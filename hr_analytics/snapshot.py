@@ -0,0 +1,155 @@
+"""Columnar snapshot cache in front of the Excel readers.
+
+Parsing .xlsx through openpyxl is by far the slowest step of a cold start, so
+every sheet read is snapshotted to Arrow IPC after the first parse and
+memory-mapped on later loads. Snapshots are keyed by path, mtime, size and
+read options; when a workbook changes its key changes and it is re-parsed.
+"""
+import glob
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from . import telemetry
+from .xlsx_stream import read_records
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    pa = None
+
+CACHE_DIR = os.environ.get("HR_CACHE_DIR", ".hr_cache")
+SNAPSHOT_DIR = CACHE_DIR
+SNAPSHOT_VERSION = 3
+
+
+def file_fingerprint(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _snapshot_stem(fingerprint, sheet_name, options):
+    src_path = fingerprint[0]
+    sheet_id = hashlib.sha1(f"{src_path}|{sheet_name}".encode()).hexdigest()[:16]
+    version_id = hashlib.sha1(repr((SNAPSHOT_VERSION, fingerprint, options)).encode()).hexdigest()[:16]
+    return sheet_id, version_id
+
+
+def _is_scalar_mix(series):
+    return series.map(lambda v: v is None or isinstance(v, (str, int, float))).all()
+
+
+def _restore_scalar(v):
+    if v is None: return v
+    for cast in (int, float):
+        try: return cast(v)
+        except ValueError: pass
+    return v
+
+
+def _write_snapshot(df, base):
+    """Writes df as Arrow IPC (or pickle when Arrow can't hold it) and returns the path."""
+    if pa is not None and all(isinstance(c, str) for c in df.columns):
+        out, mixed = df, []
+        for col in df.columns:
+            if df[col].dtype != object: continue
+            try:
+                pa.array(df[col], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                if not _is_scalar_mix(df[col]): break
+                # int/str mixes (e.g. section labels inside a number column)
+                # are stored as strings and cast back on read
+                if out is df: out = df.copy()
+                out[col] = df[col].map(lambda v: v if pd.isna(v) else str(v))
+                mixed.append(col)
+        else:
+            table = pa.Table.from_pandas(out.reset_index(drop=True), preserve_index=False)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"hr_mixed": json.dumps(mixed).encode()})
+            path = base + ".arrow"
+            feather.write_feather(table, path + ".tmp", compression="uncompressed")
+            os.replace(path + ".tmp", path)
+            return path
+    path = base + ".pkl"
+    df.to_pickle(path + ".tmp")
+    os.replace(path + ".tmp", path)
+    return path
+
+
+def _read_snapshot(path):
+    if path.endswith(".pkl"):
+        return pd.read_pickle(path)
+    table = feather.read_table(path, memory_map=True)
+    df = table.to_pandas(split_blocks=True)  # null-free numeric columns stay views of the map
+    for col in json.loads((table.schema.metadata or {}).get(b"hr_mixed", b"[]")):
+        df[col] = df[col].map(_restore_scalar)
+    return df
+
+
+def has_snapshot(fingerprint, sheet_name, options):
+    """True when snapshotted() would read this sheet from disk instead of calling parse."""
+    sheet_id, version_id = _snapshot_stem(fingerprint, sheet_name, options)
+    base = os.path.join(SNAPSHOT_DIR, f"{sheet_id}-{version_id}")
+    return any(os.path.exists(base + ext) for ext in (".arrow", ".pkl"))
+
+
+def snapshotted(path, sheet_name, options, parse):
+    """parse() backed by the on-disk snapshot cache.
+
+    The snapshot is keyed by the file fingerprint, sheet_name (any label for
+    the part of the workbook parse reads) and options. A None from parse is
+    returned as is and not cached.
+    """
+    fingerprint = file_fingerprint(path)
+    if fingerprint is None:
+        raise FileNotFoundError(path)
+    sheet_id, version_id = _snapshot_stem(fingerprint, sheet_name, options)
+    base = os.path.join(SNAPSHOT_DIR, f"{sheet_id}-{version_id}")
+    for ext in (".arrow", ".pkl"):
+        if os.path.exists(base + ext):
+            try:
+                with telemetry.span("snapshot.read"):
+                    df = _read_snapshot(base + ext)
+                telemetry.count("snapshot.hit")
+                return df
+            except Exception:
+                os.remove(base + ext)
+
+    telemetry.count("snapshot.miss")
+    with telemetry.span("snapshot.parse_excel"):
+        df = parse()
+    if df is None: return None
+
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        # drop stale snapshots of the same sheet before writing the new one
+        for stale in glob.glob(os.path.join(SNAPSHOT_DIR, f"{sheet_id}-*")):
+            os.remove(stale)
+        with telemetry.span("snapshot.write"):
+            _write_snapshot(df, base)
+    except OSError:
+        pass  # read-only deploys still work, just without the snapshot
+    return df
+
+
+def sheet_options(header=0, header_keys=None, columns=None):
+    """The options read_sheet() keys a sheet's snapshot on."""
+    return (header, tuple(header_keys) if header_keys else None, tuple(columns) if columns else None)
+
+
+def read_sheet(path, sheet_name, header=0, header_keys=None, columns=None):
+    """pd.read_excel backed by the on-disk snapshot cache.
+
+    With header_keys the sheet is streamed in one pass (see xlsx_stream): the
+    header row is auto-detected instead of using header, and only columns are
+    kept when given. Returns None when no header row matches.
+    """
+    options = sheet_options(header, header_keys, columns)
+    if header_keys:
+        return snapshotted(path, sheet_name, options, lambda: read_records(path, sheet_name, list(header_keys), columns))
+    return snapshotted(path, sheet_name, options, lambda: pd.read_excel(path, sheet_name=sheet_name, header=header))
@@ -0,0 +1,117 @@
+"""Lightweight timing spans and cache counters for profiling real sessions.
+
+Each Streamlit rerun (or API request) calls start_run() and gets a Run that
+collects every span() and count() made on that thread. Counters are also
+summed process-wide. emit() logs a finished run as one JSON line on the
+"hr_analytics.telemetry" logger; set HR_TELEMETRY_LOG to a file path to
+have those lines appended there.
+"""
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+
+logger = logging.getLogger("hr_analytics.telemetry")
+if os.environ.get("HR_TELEMETRY_LOG"):
+    _handler = logging.FileHandler(os.environ["HR_TELEMETRY_LOG"], encoding="utf-8")
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
+_current = contextvars.ContextVar("hr_telemetry_run", default=None)
+_totals = Counter()
+_totals_lock = threading.Lock()
+
+
+class Run:
+    """Spans and counters collected during one rerun / request."""
+
+    def __init__(self, label=""):
+        self.label = label
+        self.started = time.time()
+        self._t0 = time.perf_counter()
+        self.spans = []  # (name, offset_s, duration_s, depth)
+        self.counters = Counter()
+        self._depth = 0
+
+    def to_dict(self):
+        return {
+            "label": self.label,
+            "started": self.started,
+            "total_ms": round((time.perf_counter() - self._t0) * 1000, 3),
+            "spans": [{"name": n, "offset_ms": round(o * 1000, 3), "ms": round(d * 1000, 3), "depth": depth}
+                      for n, o, d, depth in self.spans],
+            "counters": dict(self.counters),
+        }
+
+
+def start_run(label=""):
+    """Starts collecting into a fresh Run for the current thread and returns it."""
+    run = Run(label)
+    _current.set(run)
+    return run
+
+
+def current_run():
+    return _current.get()
+
+
+@contextmanager
+def span(name):
+    """Times the block into the current run (no-op outside a run)."""
+    run = _current.get()
+    if run is None:
+        yield
+        return
+    start = time.perf_counter()
+    run._depth += 1
+    try:
+        yield
+    finally:
+        run._depth -= 1
+        run.spans.append((name, start - run._t0, time.perf_counter() - start, run._depth))
+
+
+def record(name, start):
+    """Adds a span for work that began at time.perf_counter() value start."""
+    run = _current.get()
+    if run is not None:
+        run.spans.append((name, start - run._t0, time.perf_counter() - start, run._depth))
+
+
+def timed(prefix):
+    """Decorator: wraps each call in span(f"{prefix}.{function name}")."""
+    def decorator(fn):
+        name = f"{prefix}.{fn.__name__}"
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name, n=1):
+    run = _current.get()
+    if run is not None:
+        run.counters[name] += n
+    with _totals_lock:
+        _totals[name] += n
+
+
+def totals():
+    """Process-wide counter sums since start-up."""
+    with _totals_lock:
+        return dict(_totals)
+
+
+def emit(run):
+    """Logs the run as a single JSON line."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps(run.to_dict()))
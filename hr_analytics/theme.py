@@ -0,0 +1,9 @@
+"""Dashboard palette, shared by the Streamlit CSS and the chart builders."""
+PRIMARY = "#2E86C1"    # Falkenherz Blue
+SECONDARY = "#2ECC71"  # Success Green
+DANGER = "#E74C3C"     # Red for Exits
+TEXT_COLOR = "#1F2937"
+CARD_BG = "#FFFFFF"
+BG_COLOR = "#F4F6F9"
+
+PERFORMANCE_COLORS = {'High Performer': '#2ECC71', 'Average': '#F1C40F', 'Low Performer': '#E74C3C'}
@@ -0,0 +1,133 @@
+"""Workforce time series from joining and exit dates.
+
+Every employee is an interval [Joining Date, Exit Date). Headcount at any
+moment is the number of intervals started minus the number ended before it,
+read off sorted event arrays with np.searchsorted, so a series over any range
+and frequency costs a few binary searches per point instead of filtering the
+frames once per period.
+
+The monthly series is extended in place when new months (or new events after
+the last computed month) arrive; only a change to earlier history rebuilds it.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+FREQUENCIES = {"Daily": "D", "Weekly": "W", "Monthly": "M"}
+# upper bound in years -> label
+TENURE_BANDS = [(0.5, "< 6 months"), (1, "6-12 months"), (2, "1-2 years"), (5, "2-5 years"), (np.inf, "5+ years")]
+ATTRITION_MONTHS = 12
+
+_NEVER = np.datetime64("2262-04-11", "ns")  # open intervals end here
+_monthly = {"events": None, "frame": None}
+_monthly_lock = threading.Lock()
+
+
+def _dates(df, col):
+    if col not in df.columns: return np.full(len(df), np.datetime64("NaT"), dtype="datetime64[ns]")
+    return pd.to_datetime(df[col], errors="coerce").to_numpy(dtype="datetime64[ns]")
+
+
+def events(active, inactive):
+    """{"joined", "left"} paired per employee, plus sorted "starts" and "ends".
+
+    Active staff need a joining date; leavers need both dates, in order.
+    Still-employed intervals are open ("left" is far in the future).
+    """
+    a_join = _dates(active, 'Joining Date')
+    i_join, i_exit = _dates(inactive, 'Joining Date'), _dates(inactive, 'Exit Date')
+    a_join = a_join[~np.isnat(a_join)]
+    ok = ~np.isnat(i_join) & ~np.isnat(i_exit) & (i_exit >= i_join)
+    joined = np.concatenate([a_join, i_join[ok]])
+    left = np.concatenate([np.full(len(a_join), _NEVER), i_exit[ok]])
+    return {"joined": joined, "left": left, "starts": np.sort(joined), "ends": np.sort(i_exit[ok])}
+
+
+def _employed_before(ev, t):
+    """Headcount just before each instant in t."""
+    return np.searchsorted(ev["starts"], t, side="left") - np.searchsorted(ev["ends"], t, side="left")
+
+
+def _between(sorted_dates, lo, hi):
+    """Events in [lo, hi) for each pair of bounds."""
+    return np.searchsorted(sorted_dates, hi, side="left") - np.searchsorted(sorted_dates, lo, side="left")
+
+
+def series(ev, start, end, freq="M"):
+    """Per-period Headcount (at period end), Joiners, Exits and rolling 12-month Attrition %.
+
+    Periods are the freq periods ("D", "W", "M") covering start..end, indexed
+    by their start date. Attrition is the exits in the trailing 12 months over
+    the average of the 13 month-end headcounts spanning them.
+    """
+    periods = pd.period_range(pd.Timestamp(start), pd.Timestamp(end), freq=freq)
+    lo = periods.start_time.to_numpy(dtype="datetime64[ns]")
+    hi = (periods + 1).start_time.to_numpy(dtype="datetime64[ns]")
+    hi_index = pd.DatetimeIndex(hi)
+    window = [(hi_index - pd.DateOffset(months=k)).to_numpy(dtype="datetime64[ns]") for k in range(ATTRITION_MONTHS + 1)]
+    avg_headcount = np.mean([_employed_before(ev, w) for w in window], axis=0)
+    exits_12 = _between(ev["ends"], window[-1], hi)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        attrition = np.where(avg_headcount > 0, exits_12 / avg_headcount * 100, np.nan)
+    return pd.DataFrame({
+        "Headcount": _employed_before(ev, hi),
+        "Joiners": _between(ev["starts"], lo, hi),
+        "Exits": _between(ev["ends"], lo, hi),
+        "Attrition %": attrition,
+    }, index=pd.DatetimeIndex(lo, name="Period"))
+
+
+def _same_history(old, new, until):
+    """True when old and new have identical events before until."""
+    for key in ("starts", "ends"):
+        n_old, n_new = np.searchsorted(old[key], until), np.searchsorted(new[key], until)
+        if n_old != n_new or not np.array_equal(old[key][:n_old], new[key][:n_new]): return False
+    return True
+
+
+def monthly(ev, month):
+    """Monthly series from the first joining month through month=(year, month).
+
+    Reuses the previously computed months when the events before the first
+    new month are unchanged, computing only the months after them.
+    """
+    if not len(ev["starts"]): return series(ev, pd.Timestamp(*month, 1), pd.Timestamp(*month, 1))
+    first, last = pd.Timestamp(ev["starts"][0]).to_period("M"), pd.Period(year=month[0], month=month[1], freq="M")
+    with _monthly_lock:
+        prev_ev, prev = _monthly["events"], _monthly["frame"]
+    if prev is not None and prev.index[0].to_period("M") == first and prev.index[-1].to_period("M") <= last:
+        done = prev.index[-1].to_period("M")
+        # computed months only read events before the end of the last of them
+        if _same_history(prev_ev, ev, (done + 1).start_time.to_datetime64()):
+            frame = prev if done == last else pd.concat([prev, series(ev, (done + 1).start_time, last.start_time)])
+            with _monthly_lock:
+                _monthly.update(events=ev, frame=frame)
+            return frame
+    frame = series(ev, first.start_time, last.start_time)
+    with _monthly_lock:
+        _monthly.update(events=ev, frame=frame)
+    return frame
+
+
+def tenure_bands(ev, as_of):
+    """Count of people employed on as_of per TENURE_BANDS band."""
+    t = np.datetime64(pd.Timestamp(as_of), "ns")
+    employed = (ev["joined"] <= t) & (ev["left"] > t)
+    years = (t - ev["joined"][employed]) / np.timedelta64(1, "D") / 365.25
+    bounds = [-np.inf] + [b for b, _ in TENURE_BANDS]
+    bands = pd.cut(years, bounds, labels=[label for _, label in TENURE_BANDS], right=False)
+    counts = pd.Series(bands).value_counts().reindex([label for _, label in TENURE_BANDS], fill_value=0)
+    return counts.rename_axis('Tenure').reset_index(name='Count')
+
+
+def cohorts(ev, as_of, freq="Y"):
+    """Per joining cohort (freq periods): joined, still employed on as_of and retention %."""
+    t = np.datetime64(pd.Timestamp(as_of), "ns")
+    joined = ev["joined"] <= t
+    cohort = pd.PeriodIndex(ev["joined"][joined], freq=freq)
+    stayed = ev["left"][joined] > t
+    out = pd.DataFrame({"Cohort": cohort.astype(str), "Stayed": stayed}).groupby("Cohort", sort=True)["Stayed"].agg(["size", "sum"])
+    out.columns = ["Joined", "Still Employed"]
+    out["Retention %"] = out["Still Employed"] / out["Joined"] * 100
+    return out.reset_index()
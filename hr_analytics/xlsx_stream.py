@@ -0,0 +1,78 @@
+"""Single-pass streaming reader for sheets with a floating header row.
+
+The master sheet has section labels above its header, so the header row has
+to be found before the data can be read. This walks openpyxl's read-only row
+iterator once: it finds the header within the first few rows, then keeps
+only the requested columns of the rows that follow. The workbook is never
+loaded into memory as a whole and never opened twice.
+"""
+import pandas as pd
+from openpyxl import load_workbook
+
+# pandas' default na_values, so streamed sheets read like pd.read_excel ones
+NA_STRINGS = {
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+}
+
+
+def header_names(row):
+    """Column names the way pandas builds them: blanks become "Unnamed: i", repeats get ".n"."""
+    names, seen = [], {}
+    for i, v in enumerate(row):
+        name = f"Unnamed: {i}" if v is None else str(v)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def iter_records(path, sheet_name, header_keys, columns=None, probe_rows=15):
+    """Yields the header (selected column names) and then one tuple per data row.
+
+    The header row is the first of the top probe_rows rows that contains every
+    name in header_keys; nothing is yielded if there is none. With columns,
+    only those (that exist) are kept, in the given order.
+    """
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name]
+        ws.reset_dimensions()  # some exporters write a wrong <dimension>; don't trust it
+        rows = ws.iter_rows(values_only=True)
+        for i, row in enumerate(rows):
+            if i >= probe_rows: return
+            cells = {str(v) for v in row if v is not None}
+            if all(k in cells for k in header_keys): break
+        else:
+            return
+        names = header_names(row)
+        wanted = [c for c in (columns or names) if c in names]
+        positions = [names.index(c) for c in wanted]
+        width = len(names)
+        yield wanted
+        for row in rows:
+            if len(row) < width: row = row + (None,) * (width - len(row))
+            yield tuple(None if isinstance(v, str) and v in NA_STRINGS else v for v in (row[p] for p in positions))
+    finally:
+        wb.close()
+
+
+def read_records(path, sheet_name, header_keys, columns=None, probe_rows=15):
+    """iter_records() collected into a DataFrame, or None when no header row matches."""
+    records = iter_records(path, sheet_name, header_keys, columns, probe_rows)
+    header = next(records, None)
+    if header is None: return None
+    df = pd.DataFrame.from_records(list(records), columns=header)
+    # drop trailing blank rows, as pd.read_excel does
+    filled = df.notna().any(axis=1).to_numpy()
+    last = filled.nonzero()[0].max() + 1 if filled.any() else 0
+    df = df.iloc[:last]
+    if columns is None:
+        # and trailing blank unnamed columns
+        keep = len(df.columns)
+        while keep and df.columns[keep - 1].startswith("Unnamed: ") and df.iloc[:, keep - 1].isna().all(): keep -= 1
+        df = df.iloc[:, :keep]
+    return df.infer_objects()
@@ -0,0 +1,48 @@
+"""Smoke tests: the dashboard renders the workbooks shipped beside it."""
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from hr_analytics import ingest, leave, snapshot
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def cold_start(tmp_path, monkeypatch):
+    """Empty memos and snapshot dir, so the first run parses every workbook."""
+    monkeypatch.chdir(ROOT)
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", str(tmp_path))
+    for fn in (*ingest.LOADERS.values(), leave.read_summary, ingest.combine): fn.cache_clear()
+    yield
+    for fn in (*ingest.LOADERS.values(), leave.read_summary, ingest.combine): fn.cache_clear()
+
+
+def overview_metrics():
+    at = AppTest.from_file(os.path.join(ROOT, "dashboard.py"), default_timeout=300).run()
+    assert not at.exception, [e.value for e in at.exception]
+    return {m.label: m.value for m in at.metric}
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_overview_renders(cold_start, monkeypatch, workers):
+    # with several workers the parses run in worker processes, which must not re-run the script
+    monkeypatch.setenv("HR_INGEST_WORKERS", str(workers))
+    monkeypatch.setattr(ingest, "INGEST_WORKERS", workers)
+    metrics = overview_metrics()
+    assert metrics["Total Headcount"] == "159"
+    assert metrics["Active Employees"] == "92"
+    assert metrics["Retention Rate"] == "57.9%"
+    assert metrics["On Probation"] == "12"
+
+
+def test_parallel_parse_leaves_snapshots(cold_start, monkeypatch):
+    monkeypatch.setenv("HR_INGEST_WORKERS", "4")
+    monkeypatch.setattr(ingest, "INGEST_WORKERS", 4)
+    first = ingest.load_data()
+    for fn in (*ingest.LOADERS.values(), leave.read_summary, ingest.combine): fn.cache_clear()
+    versions = ingest.data_versions()
+    assert all(ingest.is_snapshotted(name, fp) for name, shards in versions.items() for *_, fp in shards)
+    again = ingest.load_data()
+    assert {name: len(df) for name, df in again.items()} == {name: len(df) for name, df in first.items()}
@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+from hr_analytics import aggregates, leave
+from hr_analytics.snapshot import file_fingerprint
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# two-row header as on the Summary sheet: blocks over their first column, then leave types
+BLOCKS = ["Sr.", "Employee Name", "Designation", "Qouta", None, "Availed", None, "Remaining", None,
+          "January", None, "Feb-25", None]
+TYPES = [None, None, None, "CL", "SL", "CL", "SL", "CL", "SL", "CL", "Present", "CL", "SL"]
+ROWS = [
+    (1, "Ali Raza", "Developer", 10, 8, 3, 1, 7, 7, 2, 20, 1, 0),
+    (2, None, None, 10, 8, 0, 0, 10, 8, 0, 0, 0, 0),  # blank name: a spacer row
+    (3, " Sara Khan ", "Analyst", 10, None, 12, None, -2, None, None, 18, "", 1),
+]
+
+
+def test_column_map_classifies_by_block_not_position():
+    assert leave.column_map(BLOCKS, TYPES) == [
+        (3, "Entitled", "CL"), (4, "Entitled", "SL"), (5, "Availed", "CL"), (6, "Availed", "SL"),
+        (7, "Balance", "CL"), (8, "Balance", "SL"), (9, 1, "CL"), (10, 1, "Present"), (11, 2, "CL"), (12, 2, "SL"),
+    ]
+
+
+def test_frames_are_long_and_typed():
+    ledger, monthly = leave._frames(BLOCKS, TYPES, iter(ROWS))
+    assert ledger[["Employee Name", "Leave Type"]].astype(str).values.tolist() == [
+        ["Ali Raza", "CL"], ["Ali Raza", "SL"], ["Sara Khan", "CL"],
+    ]
+    assert ledger["Availed"].tolist() == [3, 1, 12]
+    assert ledger["Balance"].tolist() == [7, 7, -2]
+    assert ledger["Availed"].sum() == 16
+    assert ledger["Entitled"].dtype == np.float32
+    assert isinstance(ledger["Leave Type"].dtype, pd.CategoricalDtype)
+    assert ledger["Leave Type"].cat.categories.tolist() == leave.TYPES
+
+    # zero and blank cells are dropped; months come from the block labels
+    rows = monthly.astype({"Employee Name": str, "Leave Type": str}).values.tolist()
+    assert rows == [
+        ["Ali Raza", "CL", 1, 2.0], ["Ali Raza", "Present", 1, 20.0], ["Ali Raza", "CL", 2, 1.0],
+        ["Sara Khan", "Present", 1, 18.0], ["Sara Khan", "SL", 2, 1.0],
+    ]
+
+
+def test_read_summary_from_a_workbook(tmp_path):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = leave.SHEET
+    for row in (BLOCKS, TYPES, *ROWS): ws.append(list(row))
+    path = str(tmp_path / "Leave Record - 2026.xlsx")
+    wb.save(path)
+
+    ledger, monthly = leave.read_summary(path, file_fingerprint(path))
+    assert len(ledger) == 3 and len(monthly) == 5
+    monthly = monthly.assign(Period="2026")
+    assert leave.month_start(monthly).dt.strftime("%Y-%m").tolist() == ["2026-01", "2026-01", "2026-02", "2026-01", "2026-02"]
+
+
+def test_sheet_without_employee_names_is_empty(tmp_path):
+    wb = Workbook()
+    wb.active.title = leave.SHEET
+    wb.active.append(["Something else"])
+    path = str(tmp_path / "Leave Record - 2026.xlsx")
+    wb.save(path)
+    ledger, monthly = leave.read_summary(path, file_fingerprint(path))
+    assert ledger.empty and list(ledger.columns) == leave.LEDGER_COLUMNS
+    assert monthly.empty and list(monthly.columns) == leave.MONTHLY_COLUMNS
+
+
+def test_sample_leave_total():
+    # Availed days of leave types only; attendance counts (Present, NLT, WFH) and
+    # monthly columns are not leave taken
+    path = os.path.join(ROOT, "Leave Record - 2025.xlsx")
+    ledger, monthly = leave.read_summary(path, file_fingerprint(path))
+    aggs = aggregates._leave({"leave": ledger.assign(Period="2025"), "leave_monthly": monthly.assign(Period="2025")}, None)
+    assert aggs["leave_total"] == 1289.5  # "1290" on the Performance & Leave page
+    assert aggs["leave_overdrawn"] == 2
@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+from hr_analytics import orggraph
+
+ROSTER = [
+    # name, reporting to, office
+    ("Shahzad Ali", "CEO", "Lahore"),
+    ("Ali Shahzad", "Shahzad", "Lahore"),  # both names hold "shahzad"; the one starting with it wins
+    ("Sara Khan", "M. Sajid", "Lahore"),
+    ("Sara Malik", "Shahzad Ali", "Dubai"),
+    ("Muhammad Sajid", "Shahzad Ali", "Lahore"),
+    ("Omar Farooq", "Sara", "Karachi"),  # two Saras, neither in Karachi
+    ("Bilal Ahmed", "Sara", "Dubai"),  # the Dubai Sara
+    ("Hina Aslam", "Iqra", "Lahore"),
+    ("Iqra Tariq", "Hina", "Lahore"),
+    ("Noor Fatima", None, "Lahore"),
+    ("Ahmed Raza", "Shahzad Ali & M. Sajid", "Lahore"),
+]
+
+
+@pytest.fixture
+def graph():
+    names, reports, offices = zip(*ROSTER)
+    return orggraph.OrgGraph(names, reports, offices)
+
+
+def parent_name(graph, name):
+    p = graph.parent[graph.node(name)]
+    return graph.names[p] if p != -1 else None
+
+
+def test_name_tokens_normalize_aliases():
+    assert orggraph.name_tokens("M. Sajid") == ("muhammad", "sajid")
+    assert orggraph.name_tokens("Mohammed  SAJID") == ("muhammad", "sajid")
+
+
+def test_resolve_prefers_leading_token_and_office(graph):
+    assert parent_name(graph, "Ali Shahzad") == "Shahzad Ali"
+    assert parent_name(graph, "Sara Khan") == "Muhammad Sajid"
+    assert parent_name(graph, "Bilal Ahmed") == "Sara Malik"
+
+
+def test_ambiguous_and_unknown_managers_become_external_nodes(graph):
+    assert parent_name(graph, "Omar Farooq") == "Sara"
+    assert parent_name(graph, "Shahzad Ali") == "CEO"
+    assert graph.node("Sara") >= graph.n_employees and graph.node("CEO") >= graph.n_employees
+    assert dict(graph.unresolved) == {"CEO": 1, "Sara": 1}
+
+
+def test_several_managers_keep_the_first_as_parent(graph):
+    node = graph.node("Ahmed Raza")
+    assert parent_name(graph, "Ahmed Raza") == "Shahzad Ali"
+    assert [graph.names[m] for m in graph.also_reports_to[node]] == ["Muhammad Sajid"]
+
+
+def test_two_node_cycle_is_cut_at_its_first_member(graph):
+    assert graph.cycles == [["Hina Aslam", "Iqra Tariq"]]
+    assert parent_name(graph, "Hina Aslam") is None
+    assert parent_name(graph, "Iqra Tariq") == "Hina Aslam"
+
+
+def test_subtree_is_a_contiguous_depth_first_slice(graph):
+    top = graph.node("Shahzad Ali")
+    under = {graph.names[n] for n in graph.subtree(top)}
+    assert under == {"Ali Shahzad", "Sara Malik", "Bilal Ahmed", "Muhammad Sajid", "Sara Khan", "Ahmed Raza"}
+    assert graph.names[graph.subtree(top, include_self=True)[0]] == "Shahzad Ali"
+    assert {graph.names[n] for n in graph.reports(top)} == {"Ali Shahzad", "Sara Malik", "Muhammad Sajid", "Ahmed Raza"}
+    assert [graph.names[n] for n in graph.chain(graph.node("Sara Khan"))] == ["CEO", "Shahzad Ali", "Muhammad Sajid"]
+    assert graph.depth[graph.node("Sara Khan")] == 3
+
+
+def test_orphans_give_the_reason(graph):
+    orphans = graph.orphans().set_index("Name")["Reason"].to_dict()
+    assert orphans == {
+        "Shahzad Ali": "Manager not on roster",
+        "Omar Farooq": "Manager not on roster",
+        "Hina Aslam": "Reporting loop",
+        "Noor Fatima": "No manager recorded",
+    }
+
+
+def test_team_adds_level_and_manager(graph):
+    df = pd.DataFrame({"Name": [name for name, _, _ in ROSTER]})
+    team = graph.team(graph.node("Muhammad Sajid"), df)
+    assert team.to_dict("records") == [{"Name": "Sara Khan", "Level": 1, "Manager": "Muhammad Sajid"}]
+    assert graph.team(graph.node("Muhammad Sajid"), df) is team
@@ -0,0 +1,66 @@
+import json
+import os
+import zipfile
+
+from hr_analytics import policies
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def write_docx(path, paragraphs):
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("word/document.xml", f'<w:document xmlns:w="{W}"><w:body>{body}</w:body></w:document>')
+
+
+def corpus(tmp_path):
+    write_docx(tmp_path / "Leave Policy.docx", [
+        "Annual leave is earned monthly and must be approved by the line manager.",
+        "Sick leave beyond two days needs a medical certificate.",
+    ])
+    write_docx(tmp_path / "Travel Policy.docx", [
+        "Travel claims are settled monthly against receipts.",
+        "Managers approve travel before booking; leave during travel is not allowed.",
+    ])
+    return policies.document_versions(str(tmp_path))
+
+
+def test_search_ranks_the_denser_document_first(tmp_path):
+    index = policies.PolicyIndex(policies.sync_store(corpus(tmp_path), str(tmp_path / "cache")))
+    hits = index.search("sick leave")
+    assert [h["Document"] for h in hits] == ["Leave Policy", "Travel Policy"]
+    assert hits[0]["Score"] > hits[1]["Score"]
+    assert hits[0]["Terms"] == ["sick", "leave"]
+    assert index.search("receipts")[0]["Document"] == "Travel Policy"
+    assert index.search("payroll") == []
+
+
+def test_snippet_marks_query_terms_and_trims():
+    text = " ".join(f"w{i}" for i in range(50)) + " Sick leave needs a certificate."
+    out = policies.snippet(text, ["sick", "leave"], words=10)
+    assert out == "… w45 w46 w47 w48 w49 **Sick** **leave** needs a certificate."
+    assert policies.snippet("no match here", ["sick"]) == "no match here"
+
+
+def test_store_only_rereads_changed_documents(tmp_path, monkeypatch):
+    cache = str(tmp_path / "cache")
+    versions = corpus(tmp_path)
+    policies.sync_store(versions, cache)
+    with open(os.path.join(cache, policies.INDEX_FILE), encoding="utf-8") as f:
+        assert len(json.load(f)["docs"]) == 2
+
+    write_docx(tmp_path / "Travel Policy.docx", ["Per diem rates are reviewed yearly."])
+    os.utime(tmp_path / "Travel Policy.docx", ns=(1, 1))
+    reads = []
+    entry = policies._document_entry
+    monkeypatch.setattr(policies, "_document_entry", lambda path, fp: reads.append(os.path.basename(path)) or entry(path, fp))
+    docs = policies.sync_store(policies.document_versions(str(tmp_path)), cache)
+    assert reads == ["Travel Policy.docx"]
+    assert policies.PolicyIndex(docs).search("diem")[0]["Document"] == "Travel Policy"
+
+
+def test_unwritable_index_path_still_searches(tmp_path):
+    (tmp_path / "not-a-dir").write_text("")
+    docs = policies.sync_store(corpus(tmp_path), str(tmp_path / "not-a-dir" / "cache"))
+    assert policies.PolicyIndex(docs).search("certificate")[0]["Document"] == "Leave Policy"
+    assert not os.path.exists(tmp_path / "not-a-dir" / "cache")
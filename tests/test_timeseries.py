@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hr_analytics import timeseries
+
+
+@pytest.fixture(autouse=True)
+def fresh_monthly(monkeypatch):
+    monkeypatch.setattr(timeseries, "_monthly", {"events": None, "frame": None})
+
+
+def frames(active_joins, inactive):
+    active = pd.DataFrame({"Joining Date": pd.to_datetime(active_joins)})
+    joins, exits = zip(*inactive) if inactive else ((), ())
+    return active, pd.DataFrame({"Joining Date": pd.to_datetime(list(joins)), "Exit Date": pd.to_datetime(list(exits))})
+
+
+def test_events_drop_undated_and_reversed_intervals():
+    active, inactive = frames(["2024-01-01", None], [("2024-01-31", "2024-03-01"), ("2024-05-01", "2024-04-01"), (None, "2024-02-01")])
+    ev = timeseries.events(active, inactive)
+    assert len(ev["joined"]) == 2
+    assert list(ev["ends"]) == [np.datetime64("2024-03-01", "ns")]
+
+
+def test_series_counts_intervals_at_month_boundaries():
+    # joined on the last day of January, left on the first of March: a January joiner, a March exit
+    ev = timeseries.events(*frames(["2024-01-01", "2024-02-01"], [("2024-01-31", "2024-03-01")]))
+    s = timeseries.series(ev, "2024-01-01", "2024-03-01")
+    assert list(s.index.strftime("%Y-%m")) == ["2024-01", "2024-02", "2024-03"]
+    assert s["Joiners"].tolist() == [2, 1, 0]
+    assert s["Exits"].tolist() == [0, 0, 1]
+    assert s["Headcount"].tolist() == [2, 3, 2]
+    # one exit over the average of the 13 month-end headcounts (2 + 3 + 2, the rest 0)
+    assert s["Attrition %"].iloc[-1] == pytest.approx(100 * 13 / 7)
+
+
+def test_series_weekly_periods_start_on_monday():
+    ev = timeseries.events(*frames(["2024-01-07", "2024-01-08"], []))
+    s = timeseries.series(ev, "2024-01-01", "2024-01-08", freq="W")
+    assert list(s.index.strftime("%Y-%m-%d")) == ["2024-01-01", "2024-01-08"]
+    assert s["Joiners"].tolist() == [1, 1]
+
+
+def test_monthly_reuses_months_when_a_shard_only_adds_later_rows(monkeypatch):
+    base = frames(["2023-06-15", "2023-09-01"], [("2023-07-01", "2023-12-20")])
+    first = timeseries.monthly(timeseries.events(*base), (2024, 1))
+
+    calls = []
+    series = timeseries.series
+    monkeypatch.setattr(timeseries, "series", lambda ev, start, end, freq="M": calls.append((start, end)) or series(ev, start, end, freq))
+    # another office's roster adds a February joiner; nothing before February moved
+    grown = (pd.concat([base[0], pd.DataFrame({"Joining Date": pd.to_datetime(["2024-02-10"])})], ignore_index=True), base[1])
+    again = timeseries.monthly(timeseries.events(*grown), (2024, 2))
+
+    assert calls == [(pd.Timestamp("2024-02-01"), pd.Timestamp("2024-02-01"))]
+    pd.testing.assert_frame_equal(again.iloc[:-1], first)
+    assert again["Joiners"].iloc[-1] == 1 and again["Headcount"].iloc[-1] == 3
+
+
+def test_monthly_rebuilds_when_earlier_history_changes(monkeypatch):
+    base = frames(["2023-06-15"], [("2023-07-01", "2023-12-20")])
+    timeseries.monthly(timeseries.events(*base), (2024, 1))
+
+    calls = []
+    series = timeseries.series
+    monkeypatch.setattr(timeseries, "series", lambda ev, start, end, freq="M": calls.append((start, end)) or series(ev, start, end, freq))
+    corrected = frames(["2023-06-15"], [("2023-07-01", "2023-10-05")])
+    out = timeseries.monthly(timeseries.events(*corrected), (2024, 1))
+
+    assert calls == [(pd.Timestamp("2023-06-01"), pd.Timestamp("2024-01-01"))]
+    assert out.loc["2023-10-01", "Exits"] == 1 and out.loc["2023-12-01", "Exits"] == 0